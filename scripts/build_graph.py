@@ -11,9 +11,23 @@ This script creates a directed graph with:
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import networkx as nx
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Optional JIT compiler for the per-airport cumulative pass; fall back to pandas groupby
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional fast JSON encoder/decoder; fall back to the stdlib json module
+    orjson = None
 
 # Add parent directory to path for imports
 project_root = Path(__file__).parent.parent
@@ -22,7 +36,7 @@ sys.path.insert(0, str(project_root))
 # Import the data loading functions from load_sample_data.py
 # Handle import path issues
 try:
-    from scripts.load_sample_data import load_airports, load_flights, parse_iso8601_datetime
+    from scripts.load_sample_data import FlightRecord, load_airports, load_flights
 except ImportError:
     # Fallback: import directly if running as module
     import importlib.util
@@ -30,20 +44,29 @@ except ImportError:
     spec = importlib.util.spec_from_file_location("load_sample_data", load_sample_data_path)
     load_sample_data = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(load_sample_data)
+    FlightRecord = load_sample_data.FlightRecord
     load_airports = load_sample_data.load_airports
     load_flights = load_sample_data.load_flights
-    parse_iso8601_datetime = load_sample_data.parse_iso8601_datetime
 
 
-def create_airport_nodes(G: nx.MultiDiGraph, airports: Dict[str, Dict]) -> None:
+def create_airport_nodes(G: nx.MultiDiGraph, airports: Dict[str, Dict], verbose: bool = False) -> None:
     """
     Add airport nodes to the graph.
     
     Uses Approach 1: Time-Windowed Attributes
     Nodes are persistent entities with time-windowed metrics.
+    
+    Per-node progress lines are only written when verbose is True, and are
+    buffered into a single write after the loop.
     """
     print("\n🏢 Creating airport nodes...")
     
+    progress_lines = []
+    nodes = []
+    
+    # Same creation timestamp for every node in this batch
+    now_iso = datetime.now(timezone.utc).isoformat()
+    
     for airport_code, airport_data in airports.items():
         # Create node with core attributes
         # For now, we'll add basic attributes and can aggregate metrics later
@@ -66,220 +89,349 @@ def create_airport_nodes(G: nx.MultiDiGraph, airports: Dict[str, Dict]) -> None:
             'country': airport_data.get('country', ''),
             'latitude': latitude,
             'longitude': longitude,
-            'last_updated': datetime.now(timezone.utc).isoformat(),  # ISO 8601 string for JSON
+            'last_updated': now_iso,  # ISO 8601 string for JSON
             # Event-level snapshots will be added later when we process flights chronologically
             'time_snapshots': []
         }
         
-        G.add_node(airport_code, **node_attributes)
-        print(f"  ✓ Added airport node: {airport_code} ({airport_data.get('airport_name', '')})")
+        nodes.append((airport_code, node_attributes))
+        if verbose:
+            progress_lines.append(f"  ✓ Added airport node: {airport_code} ({airport_data.get('airport_name', '')})")
     
+    # Add all nodes in one call to amortize NetworkX's per-call overhead
+    G.add_nodes_from(nodes)
+    
+    if progress_lines:
+        sys.stdout.write("\n".join(progress_lines) + "\n")
     print(f"  ✅ Created {len(airports)} airport nodes")
 
 
-def create_flight_edges(G: nx.MultiDiGraph, flights: List[Dict]) -> None:
+def filter_routable_flights(flights: List[FlightRecord]) -> List[FlightRecord]:
+    """
+    Return only flights that have both an origin and a destination.
+    
+    Run once before create_flight_edges / create_event_level_snapshots so
+    neither has to re-check every record.
+    """
+    routable = []
+    for flight in flights:
+        if flight.origin and flight.destination:
+            routable.append(flight)
+        else:
+            print(f"  ⚠️  Skipping flight with missing origin/destination: {flight.flight_id or 'unknown'}")
+    return routable
+
+
+def create_flight_edges(G: nx.MultiDiGraph, flights: List[FlightRecord], verbose: bool = False) -> None:
     """
     Add flight edges to the graph.
     
     Uses Approach 1: Time-Stamped Attributes
     Each edge includes temporal attributes with full datetime values.
+    Expects flights already passed through filter_routable_flights.
+    
+    Per-edge progress lines are only written when verbose is True, and are
+    buffered into a single write after the loop.
     """
     print("\n✈️  Creating flight edges...")
     
     edges_added = 0
+    progress_lines = []
+    edges = []
+    
+    # Running bounds of the effective departure/arrival times, stored on the
+    # graph so time-range queries do not have to scan every edge
+    first_departure = None
+    last_arrival = None
     
     for flight in flights:
-        origin = flight.get('origin')
-        destination = flight.get('destination')
-        
-        if not origin or not destination:
-            print(f"  ⚠️  Skipping flight with missing origin/destination: {flight.get('flight_id', 'unknown')}")
-            continue
+        origin = flight.origin
+        destination = flight.destination
         
         # Build edge attributes following the schema
-        # All datetime values stored as ISO 8601 strings for JSON serialization
-        edge_attributes = {
-            'flight_id': flight.get('flight_id', ''),
-            'flight_number': flight.get('flight_number', ''),
-            'carrier': flight.get('carrier', ''),
-            'equipment': flight.get('equipment', ''),
-            'equipment_class': flight.get('equipment_class', ''),
-            
-            # Temporal attributes (stored as ISO 8601 strings)
-            'scheduled_departure_gate': flight.get('scheduled_departure_gate').isoformat() if flight.get('scheduled_departure_gate') else None,
-            'actual_departure_gate': flight.get('actual_departure_gate').isoformat() if flight.get('actual_departure_gate') else None,
-            'scheduled_arrival_gate': flight.get('scheduled_arrival_gate').isoformat() if flight.get('scheduled_arrival_gate') else None,
-            'actual_arrival_gate': flight.get('actual_arrival_gate').isoformat() if flight.get('actual_arrival_gate') else None,
-            
-            # Derived temporal attributes
-            'flight_date': str(flight.get('flight_date')) if flight.get('flight_date') else None,
-            'flight_month_year': flight.get('flight_month_year', ''),
-            'departure_delay_minutes': flight.get('departure_delay_minutes'),
-            'arrival_delay_minutes': flight.get('arrival_delay_minutes'),
-        }
+        # None values are skipped as we go to keep the graph clean
+        edge_attributes = {}
+        if flight.flight_id is not None:
+            edge_attributes['flight_id'] = flight.flight_id
+        edge_attributes['flight_number'] = flight.flight_number
+        edge_attributes['carrier'] = flight.carrier
+        edge_attributes['equipment'] = flight.equipment
+        edge_attributes['equipment_class'] = flight.equipment_class
         
-        # Remove None values to keep the graph clean
-        edge_attributes = {k: v for k, v in edge_attributes.items() if v is not None}
+        # Temporal attributes (kept as datetimes in memory; save_graph writes
+        # them as ISO 8601 strings)
+        if flight.scheduled_departure_gate:
+            edge_attributes['scheduled_departure_gate'] = flight.scheduled_departure_gate
+        if flight.actual_departure_gate:
+            edge_attributes['actual_departure_gate'] = flight.actual_departure_gate
+        if flight.scheduled_arrival_gate:
+            edge_attributes['scheduled_arrival_gate'] = flight.scheduled_arrival_gate
+        if flight.actual_arrival_gate:
+            edge_attributes['actual_arrival_gate'] = flight.actual_arrival_gate
         
-        # Add edge (MultiDiGraph allows multiple edges between same airports)
+        # Effective departure/arrival (actual, falling back to scheduled) as
+        # POSIX seconds, so queries can skip re-parsing the ISO strings
+        dep_time = flight.actual_departure_gate or flight.scheduled_departure_gate
+        arr_time = flight.actual_arrival_gate or flight.scheduled_arrival_gate
+        if dep_time:
+            edge_attributes['_dep_ts'] = dep_time.timestamp()
+            if first_departure is None or dep_time < first_departure:
+                first_departure = dep_time
+        if arr_time:
+            edge_attributes['_arr_ts'] = arr_time.timestamp()
+            if last_arrival is None or arr_time > last_arrival:
+                last_arrival = arr_time
+        
+        # Derived temporal attributes
+        if flight.flight_date:
+            edge_attributes['flight_date'] = str(flight.flight_date)
+        edge_attributes['flight_month_year'] = flight.flight_month_year
+        if flight.departure_delay_minutes is not None:
+            edge_attributes['departure_delay_minutes'] = flight.departure_delay_minutes
+        if flight.arrival_delay_minutes is not None:
+            edge_attributes['arrival_delay_minutes'] = flight.arrival_delay_minutes
+        
+        # Queue edge (MultiDiGraph allows multiple edges between same airports)
         # Each flight is a separate edge, even if origin/destination are the same
-        G.add_edge(origin, destination, **edge_attributes)
+        edges.append((origin, destination, edge_attributes))
         edges_added += 1
         
-        print(f"  ✓ Added edge: {origin} → {destination} ({flight.get('carrier', '')}{flight.get('flight_number', '')})")
+        if verbose:
+            progress_lines.append(f"  ✓ Added edge: {origin} → {destination} ({flight.carrier}{flight.flight_number})")
     
+    # Add all edges in one call to amortize NetworkX's per-call overhead
+    G.add_edges_from(edges)
+    
+    if first_departure:
+        G.graph['first_departure'] = first_departure
+    if last_arrival:
+        G.graph['last_arrival'] = last_arrival
+    
+    if progress_lines:
+        sys.stdout.write("\n".join(progress_lines) + "\n")
     print(f"  ✅ Created {edges_added} flight edges")
 
 
-def create_event_level_snapshots(G: nx.MultiDiGraph, flights: List[Dict]) -> None:
+# Fewest events for which compute_cumulative_metrics uses the Numba kernel;
+# below this the pandas groupby is faster than JIT compilation and dispatch
+NUMBA_MIN_EVENTS = 500_000
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _grouped_cumsum(values, order, offsets):
+        """
+        Running column sums within each group, one group per parallel worker.
+        
+        Rows of group g are order[offsets[g]:offsets[g + 1]] in event order.
+        """
+        running = np.empty_like(values)
+        for group in prange(len(offsets) - 1):
+            total = np.zeros(values.shape[1])
+            for position in range(offsets[group], offsets[group + 1]):
+                row = order[position]
+                total += values[row]
+                running[row] = total
+        return running
+
+
+def compute_cumulative_metrics(
+    airports: List[str],
+    is_departure: List[bool],
+    delays: List[Optional[float]]
+) -> pd.DataFrame:
+    """
+    Compute running per-airport metrics for a chronologically ordered event list.
+    
+    Args:
+        airports: Airport code of each event
+        is_departure: True for departure events, False for arrivals
+        delays: Delay in minutes relevant to each event (None if unknown)
+    
+    Returns:
+        DataFrame aligned with the inputs holding the cumulative totals,
+        average delays and on-time percentages as of each event.
+    
+    On-time = delay <= 0 (exactly on-time or early); any positive delay is late.
+    """
+    airport_keys = pd.Series(airports, dtype=object)
+    dep = np.asarray(is_departure, dtype=bool)
+    arr = ~dep
+    delay = pd.to_numeric(pd.Series(delays, dtype=object), errors='coerce').to_numpy(dtype=float)
+    has_delay = ~np.isnan(delay)
+    on_time = has_delay & (np.nan_to_num(delay, nan=1.0) <= 0)
+    delay_or_zero = np.where(has_delay, delay, 0.0)
+    
+    columns = pd.DataFrame({
+        'total_departures': dep.astype(np.int64),
+        'total_arrivals': arr.astype(np.int64),
+        'dep_delay_sum': np.where(dep, delay_or_zero, 0.0),
+        'arr_delay_sum': np.where(arr, delay_or_zero, 0.0),
+        'dep_delay_count': (dep & has_delay).astype(np.int64),
+        'arr_delay_count': (arr & has_delay).astype(np.int64),
+        'on_time_dep': (dep & on_time).astype(np.int64),
+        'on_time_arr': (arr & on_time).astype(np.int64),
+    })
+    
+    if njit is None or len(columns) < NUMBA_MIN_EVENTS:
+        running = columns.groupby(airport_keys, sort=False).cumsum()
+    else:
+        # Airports are independent, so accumulate large schedules in parallel
+        # with Numba. Counts are small integers and stay exact in float64.
+        codes, uniques = pd.factorize(airport_keys)
+        order = np.argsort(codes, kind='stable')
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(uniques)))))
+        running = pd.DataFrame(
+            _grouped_cumsum(columns.to_numpy(dtype=np.float64), order, offsets),
+            columns=columns.columns
+        )
+        count_columns = [name for name in columns.columns if not name.endswith('_sum')]
+        running[count_columns] = running[count_columns].astype(np.int64)
+    
+    total_dep = running['total_departures'].to_numpy()
+    total_arr = running['total_arrivals'].to_numpy()
+    dep_count = running['dep_delay_count'].to_numpy()
+    arr_count = running['arr_delay_count'].to_numpy()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return pd.DataFrame({
+            'total_departures': total_dep,
+            'total_arrivals': total_arr,
+            'avg_departure_delay': np.where(dep_count > 0, running['dep_delay_sum'].to_numpy() / dep_count, 0.0),
+            'avg_arrival_delay': np.where(arr_count > 0, running['arr_delay_sum'].to_numpy() / arr_count, 0.0),
+            'on_time_departure_pct': np.where(total_dep > 0, running['on_time_dep'].to_numpy() / total_dep * 100, 0.0),
+            'on_time_arrival_pct': np.where(total_arr > 0, running['on_time_arr'].to_numpy() / total_arr * 100, 0.0),
+        })
+
+
+def create_event_level_snapshots(G: nx.MultiDiGraph, flights: List[FlightRecord]) -> None:
     """
     Create event-level snapshots for airport nodes.
     
     Uses event-level temporal tracking: snapshots created on every departure and arrival.
     Each snapshot tracks both incremental changes (delta) and cumulative values (totals).
+    Expects flights already passed through filter_routable_flights.
     """
     print(f"\n📊 Creating event-level snapshots for airport nodes...")
     
+    import heapq
     from collections import defaultdict
+    from itertools import count
     
-    # Track cumulative metrics per airport (updated as events occur)
-    airport_cumulative = defaultdict(lambda: {
-        'total_departures': 0,
-        'total_arrivals': 0,
-        'departure_delays': [],
-        'arrival_delays': []
-    })
-    
-    # Collect all events (departures and arrivals) with timestamps
-    events = []
+    # Collect departure and arrival events as tuples:
+    # (timestamp, sequence, airport, event_type, flight_id, flight)
+    # The shared sequence number keeps ties in input order and ensures tuple
+    # comparison never reaches the flight record
+    sequence = count()
+    departure_events = []
+    arrival_events = []
     
     for flight in flights:
-        origin = flight.get('origin')
-        destination = flight.get('destination')
-        flight_id = flight.get('flight_id', '')
-        
-        if not origin or not destination:
-            continue
+        origin = flight.origin
+        destination = flight.destination
+        flight_id = flight.flight_id
         
         # Departure event (use actual departure time, fallback to scheduled)
-        dep_time = flight.get('actual_departure_gate') or flight.get('scheduled_departure_gate')
+        # Gate times are already parsed to datetimes by load_flights
+        dep_time = flight.actual_departure_gate or flight.scheduled_departure_gate
         if dep_time:
-            if isinstance(dep_time, str):
-                dep_time = parse_iso8601_datetime(dep_time)
-            if dep_time and isinstance(dep_time, datetime):
-                events.append({
-                    'airport': origin,
-                    'event_type': 'departure',
-                    'timestamp': dep_time,
-                    'flight_id': flight_id,
-                    'flight': flight
-                })
+            departure_events.append((dep_time, next(sequence), origin, 'departure', flight_id, flight))
         
         # Arrival event (use actual arrival time, fallback to scheduled)
-        arr_time = flight.get('actual_arrival_gate') or flight.get('scheduled_arrival_gate')
+        arr_time = flight.actual_arrival_gate or flight.scheduled_arrival_gate
         if arr_time:
-            if isinstance(arr_time, str):
-                arr_time = parse_iso8601_datetime(arr_time)
-            if arr_time and isinstance(arr_time, datetime):
-                events.append({
-                    'airport': destination,
-                    'event_type': 'arrival',
-                    'timestamp': arr_time,
-                    'flight_id': flight_id,
-                    'flight': flight
-                })
-    
-    # Sort events by timestamp
-    events.sort(key=lambda e: e['timestamp'])
-    
-    # Process events chronologically and create snapshots
-    for event in events:
-        airport_code = event['airport']
-        event_type = event['event_type']
-        timestamp = event['timestamp']
-        flight_id = event['flight_id']
-        flight = event['flight']
-        
-        if airport_code not in G.nodes():
-            continue
-        
-        # Initialize time_snapshots list if not exists
-        if 'time_snapshots' not in G.nodes[airport_code]:
-            G.nodes[airport_code]['time_snapshots'] = []
-        
-        # Calculate incremental changes (only what changed at this event)
-        incremental = {}
-        if event_type == 'departure':
-            incremental['departures'] = 1
-            if flight.get('departure_delay_minutes') is not None:
-                incremental['departure_delay_minutes'] = flight['departure_delay_minutes']
-        elif event_type == 'arrival':
-            incremental['arrivals'] = 1
-            if flight.get('arrival_delay_minutes') is not None:
-                incremental['arrival_delay_minutes'] = flight['arrival_delay_minutes']
-        
-        # Update cumulative metrics
-        if event_type == 'departure':
-            airport_cumulative[airport_code]['total_departures'] += 1
-            if flight.get('departure_delay_minutes') is not None:
-                airport_cumulative[airport_code]['departure_delays'].append(flight['departure_delay_minutes'])
-        elif event_type == 'arrival':
-            airport_cumulative[airport_code]['total_arrivals'] += 1
-            if flight.get('arrival_delay_minutes') is not None:
-                airport_cumulative[airport_code]['arrival_delays'].append(flight['arrival_delay_minutes'])
-        
-        # Calculate cumulative values
-        cumulative = airport_cumulative[airport_code]
-        total_dep = cumulative['total_departures']
-        total_arr = cumulative['total_arrivals']
-        
-        # Calculate average delays
-        dep_delays = cumulative['departure_delays']
-        arr_delays = cumulative['arrival_delays']
-        avg_dep_delay = sum(dep_delays) / len(dep_delays) if dep_delays else 0.0
-        avg_arr_delay = sum(arr_delays) / len(arr_delays) if arr_delays else 0.0
-        
-        # Count on-time flights
-        # On-time = delay <= 0 (exactly on-time or early)
-        # Any positive delay (> 0) is considered late
-        on_time_dep = sum(1 for d in dep_delays if d <= 0) if dep_delays else 0
-        on_time_arr = sum(1 for d in arr_delays if d <= 0) if arr_delays else 0
-        on_time_dep_pct = (on_time_dep / total_dep * 100) if total_dep > 0 else 0.0
-        on_time_arr_pct = (on_time_arr / total_arr * 100) if total_arr > 0 else 0.0
+            arrival_events.append((arr_time, next(sequence), destination, 'arrival', flight_id, flight))
+    
+    # Sort each stream by timestamp (plain tuple comparison, no key function)
+    departure_events.sort()
+    arrival_events.sort()
+    
+    # Bind node lookups once
+    graph_nodes = G.nodes
+    valid_airports = set(graph_nodes)
+    
+    # Merge the two sorted streams and skip events for airports missing from
+    # the graph in the same pass, so the filtered list is the only combined copy
+    events = [
+        event for event in heapq.merge(departure_events, arrival_events)
+        if event[2] in valid_airports
+    ]
+    
+    # Cumulative metrics for every event, computed column-wise per airport
+    event_airports = [event[2] for event in events]
+    is_departure = [event[3] == 'departure' for event in events]
+    event_delays = [
+        event[5].departure_delay_minutes if departure else event[5].arrival_delay_minutes
+        for event, departure in zip(events, is_departure)
+    ]
+    metrics = compute_cumulative_metrics(event_airports, is_departure, event_delays)
+    
+    # Snapshots are collected locally and attached to the nodes once at the end
+    snapshots_by_airport = defaultdict(list)
+    
+    # Build snapshots in chronological order
+    for (timestamp, _, airport_code, event_type, flight_id, flight), departure, delay, total_dep, \
+            total_arr, avg_dep_delay, avg_arr_delay, on_time_dep_pct, on_time_arr_pct in zip(
+                events,
+                is_departure,
+                event_delays,
+                metrics['total_departures'].tolist(),
+                metrics['total_arrivals'].tolist(),
+                metrics['avg_departure_delay'].tolist(),
+                metrics['avg_arrival_delay'].tolist(),
+                metrics['on_time_departure_pct'].tolist(),
+                metrics['on_time_arrival_pct'].tolist()):
+        # Incremental changes (only what changed at this event), built in a single
+        # expression; the delay key is omitted when the delay is unknown
+        if departure:
+            incremental = {'departures': 1} if delay is None else {'departures': 1, 'departure_delay_minutes': delay}
+        else:
+            incremental = {'arrivals': 1} if delay is None else {'arrivals': 1, 'arrival_delay_minutes': delay}
         
         # Create snapshot
         snapshot = {
-            'timestamp': timestamp.isoformat(),  # ISO 8601 string for JSON
+            'timestamp': timestamp,  # datetime; written as ISO 8601 by save_graph
             'event_type': event_type,
             'event_flight_id': flight_id,
             'incremental': incremental,  # Already filtered to only changed values
             'cumulative': {
                 'total_departures': total_dep,
                 'total_arrivals': total_arr,
-                'avg_departure_delay': round(avg_dep_delay, 2),
-                'avg_arrival_delay': round(avg_arr_delay, 2),
-                'on_time_departure_pct': round(on_time_dep_pct, 2),
-                'on_time_arrival_pct': round(on_time_arr_pct, 2)
+                # Unrounded; consumers format for display
+                'avg_departure_delay': avg_dep_delay,
+                'avg_arrival_delay': avg_arr_delay,
+                'on_time_departure_pct': on_time_dep_pct,
+                'on_time_arrival_pct': on_time_arr_pct
             }
         }
         
         # Add snapshot to list (ordered by timestamp)
-        G.nodes[airport_code]['time_snapshots'].append(snapshot)
-        G.nodes[airport_code]['last_updated'] = timestamp.isoformat()
+        snapshots_by_airport[airport_code].append(snapshot)
+    
+    # Attach snapshots to airport nodes
+    for airport_code, snapshots in snapshots_by_airport.items():
+        node_data = graph_nodes[airport_code]
+        node_data.setdefault('time_snapshots', []).extend(snapshots)
+        node_data['last_updated'] = snapshots[-1]['timestamp']
     
     # Print summary
-    for airport_code in sorted(airport_cumulative.keys()):
-        snapshots_count = len(G.nodes[airport_code].get('time_snapshots', []))
-        cumulative = airport_cumulative[airport_code]
+    for airport_code in sorted(snapshots_by_airport.keys()):
+        snapshots_count = len(graph_nodes[airport_code].get('time_snapshots', []))
+        cumulative = snapshots_by_airport[airport_code][-1]['cumulative']
         print(f"  ✓ {airport_code}: {snapshots_count} snapshots ({cumulative['total_departures']} departures, {cumulative['total_arrivals']} arrivals)")
     
-    print(f"  ✅ Created event-level snapshots for {len(airport_cumulative)} airports")
+    print(f"  ✅ Created event-level snapshots for {len(snapshots_by_airport)} airports")
 
 
-def build_graph(data_dir: Path = None) -> nx.MultiDiGraph:
+def build_graph(data_dir: Path = None, verbose: bool = False) -> nx.MultiDiGraph:
     """
     Build the complete graph from flight and airport data.
     
+    Args:
+        data_dir: Directory containing the sample CSV files (default: data/raw)
+        verbose: Print a progress line for every node and edge added, and
+            list flights per route in the summary
+    
     Returns:
         NetworkX MultiDiGraph with airports as nodes and flights as edges.
         MultiDiGraph allows multiple edges between the same airports (multiple flights).
@@ -303,14 +455,17 @@ def build_graph(data_dir: Path = None) -> nx.MultiDiGraph:
         print("❌ Failed to load data. Cannot build graph.")
         return nx.MultiDiGraph()
     
+    # Drop flights without both endpoints once, before edges and snapshots
+    flights = filter_routable_flights(flights)
+    
     # Create directed multigraph (allows multiple edges between same airports)
     G = nx.MultiDiGraph()
     
     # Add nodes (airports)
-    create_airport_nodes(G, airports)
+    create_airport_nodes(G, airports, verbose=verbose)
     
     # Add edges (flights)
-    create_flight_edges(G, flights)
+    create_flight_edges(G, flights, verbose=verbose)
     
     # Create event-level snapshots for airports (event-based temporal tracking)
     create_event_level_snapshots(G, flights)
@@ -335,29 +490,30 @@ def build_graph(data_dir: Path = None) -> nx.MultiDiGraph:
             if snapshots_count > 0:
                 first_snapshot = node_data['time_snapshots'][0]
                 last_snapshot = node_data['time_snapshots'][-1]
-                print(f"    First event: {first_snapshot.get('timestamp', 'N/A')} ({first_snapshot.get('event_type', 'N/A')})")
-                print(f"    Last event: {last_snapshot.get('timestamp', 'N/A')} ({last_snapshot.get('event_type', 'N/A')})")
+                print(f"    First event: {first_snapshot['timestamp'].isoformat()} ({first_snapshot.get('event_type', 'N/A')})")
+                print(f"    Last event: {last_snapshot['timestamp'].isoformat()} ({last_snapshot.get('event_type', 'N/A')})")
                 # Show cumulative totals from last snapshot
                 if 'cumulative' in last_snapshot:
                     cum = last_snapshot['cumulative']
                     print(f"    Totals: {cum.get('total_departures', 0)} departures, {cum.get('total_arrivals', 0)} arrivals")
     
-    # Show routes
-    print(f"\nRoutes (Edges):")
-    routes = {}
-    # MultiDiGraph edges include a key parameter: (u, v, key, data)
-    for origin, destination, key, data in G.edges(data=True, keys=True):
-        route = f"{origin} → {destination}"
-        if route not in routes:
-            routes[route] = []
-        routes[route].append(data.get('flight_id', 'unknown'))
-    
-    for route, flight_ids in sorted(routes.items()):
-        print(f"  - {route}: {len(flight_ids)} flight(s)")
-        for flight_id in flight_ids[:3]:  # Show first 3 flight IDs
-            print(f"    * {flight_id}")
-        if len(flight_ids) > 3:
-            print(f"    ... and {len(flight_ids) - 3} more")
+    # Show routes (verbose only: this walks every edge just to print)
+    if verbose:
+        from collections import defaultdict
+        
+        print(f"\nRoutes (Edges):")
+        routes = defaultdict(list)
+        # MultiDiGraph edges include a key parameter: (u, v, key, flight_id)
+        # data='flight_id' avoids materializing each full attribute dict
+        for origin, destination, key, flight_id in G.edges(keys=True, data='flight_id', default='unknown'):
+            routes[(origin, destination)].append(flight_id)
+        
+        for (origin, destination), flight_ids in sorted(routes.items()):
+            print(f"  - {origin} → {destination}: {len(flight_ids)} flight(s)")
+            for flight_id in flight_ids[:3]:  # Show first 3 flight IDs
+                print(f"    * {flight_id}")
+            if len(flight_ids) > 3:
+                print(f"    ... and {len(flight_ids) - 3} more")
     
     print("\n" + "=" * 60)
     print("✅ Graph construction completed successfully!")
@@ -366,24 +522,94 @@ def build_graph(data_dir: Path = None) -> nx.MultiDiGraph:
     return G
 
 
-def save_graph(G: nx.MultiDiGraph, output_file: Path) -> None:
-    """Save graph to file in JSON-compatible format."""
+PICKLE_SUFFIXES = {'.pkl', '.pickle'}
+
+
+def _json_default(value):
+    """Serialize datetimes (snapshot and edge timestamps) for the stdlib json fallback."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Query caches build_graph keeps on the in-memory graph; save_graph leaves
+# them out so saved files keep the documented schema
+QUERY_CACHE_EDGE_ATTRIBUTES = ('_dep_ts', '_arr_ts')
+QUERY_CACHE_GRAPH_ATTRIBUTES = ('first_departure', 'last_arrival')
+
+
+def without_query_caches(G: nx.MultiDiGraph) -> nx.MultiDiGraph:
+    """Copy of G without the query cache attributes (G itself is not modified)."""
+    H = G.copy()
+    for key in QUERY_CACHE_GRAPH_ATTRIBUTES:
+        H.graph.pop(key, None)
+    for _, _, data in H.edges(data=True):
+        for key in QUERY_CACHE_EDGE_ATTRIBUTES:
+            data.pop(key, None)
+    return H
+
+
+def detect_graph_format(path: Path) -> str:
+    """Infer the graph file format ('pickle' or 'json') from the file suffix."""
+    return 'pickle' if path.suffix.lower() in PICKLE_SUFFIXES else 'json'
+
+
+def save_graph(G: nx.MultiDiGraph, output_file: Path, format: Optional[str] = None) -> None:
+    """
+    Save graph to file.
+    
+    Args:
+        G: Graph to save
+        output_file: Destination path
+        format: 'pickle' or 'json'; inferred from the file suffix when omitted
+            (.pkl/.pickle -> pickle, anything else -> JSON node-link)
+    
+    Pickle stores the MultiDiGraph directly and is much faster to write and
+    read back. JSON node-link format remains available for portability.
+    Either way the query caches (_dep_ts / _arr_ts on edges, first_departure /
+    last_arrival on the graph) are not written; see without_query_caches.
+    """
     print(f"\n💾 Saving graph to: {output_file}")
     
-    # NetworkX can save to various formats
-    # For JSON compatibility, we'll use node-link format
-    # MultiDiGraph is automatically detected and saved with multigraph: true
-    import json
+    if format is None:
+        format = detect_graph_format(output_file)
     
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Convert to node-link format (JSON serializable)
+    G = without_query_caches(G)
+    
+    if format == 'pickle':
+        import pickle
+        
+        with open(output_file, 'wb') as f:
+            pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        file_size_kb = output_file.stat().st_size / 1024
+        print(f"  ✅ Graph saved successfully ({file_size_kb:.2f} KB, pickle)")
+        print(f"     Nodes: {G.number_of_nodes()}")
+        print(f"     Edges: {G.number_of_edges()}")
+        print(f"     Multigraph: {G.is_multigraph()}")
+        return
+    
+    if format != 'json':
+        raise ValueError(f"Unsupported graph format: {format} (expected 'pickle' or 'json')")
+    
+    # NetworkX can save to various formats
+    # For JSON compatibility, we'll use node-link format
+    # MultiDiGraph is automatically detected and saved with multigraph: true
     graph_data = nx.node_link_data(G)
     
-    # Write to JSON file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(graph_data, f, indent=2, ensure_ascii=False)
+    # Write to JSON file (compact, UTF-8)
+    # orjson is much faster than the stdlib encoder and serializes datetimes natively
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(graph_data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        import json
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(graph_data, f, ensure_ascii=False, default=_json_default)
     
     file_size_kb = output_file.stat().st_size / 1024
     print(f"  ✅ Graph saved successfully ({file_size_kb:.2f} KB)")
@@ -392,23 +618,42 @@ def save_graph(G: nx.MultiDiGraph, output_file: Path) -> None:
     print(f"     Multigraph: {graph_data.get('multigraph', False)}")
 
 
-def load_graph(input_file: Path) -> nx.MultiDiGraph:
-    """Load graph from JSON file."""
-    import json
+def load_graph(input_file: Path, format: Optional[str] = None) -> nx.MultiDiGraph:
+    """
+    Load graph from a pickle or JSON node-link file.
     
+    The format is inferred from the file suffix when not given.
+    """
     print(f"\n📂 Loading graph from: {input_file}")
     
     if not input_file.exists():
         raise FileNotFoundError(f"Graph file not found: {input_file}")
     
-    # Read JSON file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        graph_data = json.load(f)
+    if format is None:
+        format = detect_graph_format(input_file)
     
-    # Convert from node-link format
-    # NetworkX automatically detects multigraph from the JSON data
-    # If multigraph: true in JSON, it creates MultiDiGraph; otherwise DiGraph
-    G = nx.node_link_graph(graph_data)
+    if format == 'pickle':
+        import pickle
+        
+        with open(input_file, 'rb') as f:
+            G = pickle.load(f)
+    elif format == 'json':
+        # Read JSON file
+        if orjson is not None:
+            with open(input_file, 'rb') as f:
+                graph_data = orjson.loads(f.read())
+        else:
+            import json
+            
+            with open(input_file, 'r', encoding='utf-8') as f:
+                graph_data = json.load(f)
+        
+        # Convert from node-link format
+        # NetworkX automatically detects multigraph from the JSON data
+        # If multigraph: true in JSON, it creates MultiDiGraph; otherwise DiGraph
+        G = nx.node_link_graph(graph_data)
+    else:
+        raise ValueError(f"Unsupported graph format: {format} (expected 'pickle' or 'json')")
     
     print(f"  ✅ Graph loaded successfully")
     print(f"     Nodes: {G.number_of_nodes()}")
@@ -423,9 +668,10 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Build flight graph from sample data')
-    parser.add_argument('--save', '-s', type=str, help='Save graph to JSON file')
-    parser.add_argument('--load', '-l', type=str, help='Load graph from JSON file (instead of building)')
+    parser.add_argument('--save', '-s', type=str, help='Save graph to file (.pkl/.pickle for pickle, otherwise JSON)')
+    parser.add_argument('--load', '-l', type=str, help='Load graph from a pickle or JSON file (instead of building)')
     parser.add_argument('--data-dir', '-d', type=str, help='Directory containing data files')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Print every node and edge as it is added')
     
     args = parser.parse_args()
     
@@ -436,7 +682,7 @@ def main():
     else:
         # Build graph
         data_dir = Path(args.data_dir) if args.data_dir else None
-        G = build_graph(data_dir)
+        G = build_graph(data_dir, verbose=args.verbose)
     
     # Save if requested
     if args.save:
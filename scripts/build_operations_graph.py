@@ -8,14 +8,23 @@ This script creates a directed multigraph with:
 - All attributes follow the schema defined in docs/feature__operations_resource_graph.md
 """
 
+import re
 import sys
-import csv
 import json
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple, Optional
 
 import networkx as nx
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    # Optional fast JSON encoder/decoder; fall back to the stdlib json module
+    orjson = None
 
 # Add parent directory to path for imports
 project_root = Path(__file__).parent.parent
@@ -33,12 +42,36 @@ except ImportError:
     spec.loader.exec_module(load_sample_data)
     parse_iso8601_datetime = load_sample_data.parse_iso8601_datetime
 
+# Temporal columns of the flight connections CSV
+TIME_KEYS = (
+    'source_flt_sch_dprt_gmt',
+    'source_flt_sch_arr_gmt',
+    'source_flt_actl_arr_gmt',
+    'target_flt_sch_dprt_gmt',
+    'target_flt_sch_arr_gmt',
+    'target_flt_actl_arr_gmt',
+)
+
+# Carrier/flight number part of a flight ID ("WN1234", "DAL12"): the carrier is
+# 2 characters when the third character is a digit (most common), otherwise 3
+CARRIER_FLIGHT_RE = re.compile(r'(..(?=\d)|...(?=\d))(.+)', re.DOTALL)
+
+# Vectorized equivalent of parse_flight_id: "{carrier}{flight_number}_{date}_{origin}_{destination}"
+# with a 2-character carrier when the third character is a digit, otherwise 3 characters
+FLIGHT_ID_PATTERN = (
+    r'^(?P<carrier>[^_]{2}(?=\d)|[^_]{3}(?=\d))(?P<flight_number>[^_]*)'
+    r'_(?P<flight_date>[^_]*)_(?P<origin>[^_]*)_(?P<destination>[^_]*)$'
+)
+
 
 def parse_flight_id(flight_id: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]]:
     """
     Parse flight ID format: "WN1234_2026-01-01_ATL_LGA"
     
     Returns: (carrier, flight_number, flight_date, origin, destination)
+    
+    Invalid IDs return all None without printing; callers decide how to
+    report them (build_graph summarizes them once after loading).
     """
     if not flight_id or not flight_id.strip():
         return (None, None, None, None, None)
@@ -47,7 +80,7 @@ def parse_flight_id(flight_id: str) -> Tuple[Optional[str], Optional[str], Optio
         # Format: "{carrier}{flight_number}_{date}_{origin}_{destination}"
         parts = flight_id.split('_')
         if len(parts) != 4:
-            print(f"  ⚠️  Invalid flight ID format: {flight_id} (expected 4 parts separated by '_')")
+            # Expected 4 parts separated by '_'
             return (None, None, None, None, None)
         
         carrier_flight = parts[0]  # e.g., "WN1234"
@@ -55,27 +88,16 @@ def parse_flight_id(flight_id: str) -> Tuple[Optional[str], Optional[str], Optio
         origin = parts[2]          # e.g., "ATL"
         destination = parts[3]     # e.g., "LGA"
         
-        # Extract carrier and flight number
-        # Assume carrier is 2-3 characters, rest is flight number
-        if len(carrier_flight) < 3:
-            print(f"  ⚠️  Invalid carrier/flight format: {carrier_flight}")
-            return (None, None, None, None, None)
-        
-        # Try 2-char carrier first (most common)
-        if carrier_flight[2].isdigit():
-            carrier = carrier_flight[:2]
-            flight_number = carrier_flight[2:]
-        elif len(carrier_flight) >= 3 and carrier_flight[3].isdigit():
-            carrier = carrier_flight[:3]
-            flight_number = carrier_flight[3:]
-        else:
-            print(f"  ⚠️  Could not parse carrier/flight from: {carrier_flight}")
+        # Extract carrier and flight number with one regex match
+        match = CARRIER_FLIGHT_RE.fullmatch(carrier_flight)
+        if match is None:
+            # Could not find where the carrier ends and the flight number starts
             return (None, None, None, None, None)
+        carrier, flight_number = match.groups()
         
         return (carrier, flight_number, flight_date, origin, destination)
     
-    except Exception as e:
-        print(f"  ⚠️  Error parsing flight ID '{flight_id}': {e}")
+    except Exception:
         return (None, None, None, None, None)
 
 
@@ -84,11 +106,25 @@ def parse_dt(s: str) -> Optional[datetime]:
     Parse datetime string: "2026-01-06 15:00:00.000" or "2026-01-06T15:00:00Z"
     
     Handles formats with/without milliseconds, with space or T separator.
-    Returns None for empty/invalid strings.
+    Returns None for empty/invalid strings. Naive values are treated as UTC.
     """
     if not s or not s.strip():
         return None
     
+    # Fast path: datetime.fromisoformat handles both the space-separated and
+    # the ISO 8601 "T"/"Z" forms directly
+    try:
+        dt = datetime.fromisoformat(s.strip())
+    except ValueError:
+        return _parse_dt_fallback(s)
+    
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _parse_dt_fallback(s: str) -> Optional[datetime]:
+    """Slow path for parse_dt: normalize the string and defer to parse_iso8601_datetime."""
     try:
         # Try ISO 8601 format first (with T and Z)
         if 'T' in s or s.endswith('Z'):
@@ -112,61 +148,68 @@ def parse_dt(s: str) -> Optional[datetime]:
         return None
 
 
-def ensure_flight_node(G: nx.MultiDiGraph, flight_id: str, prefix: str, row: Dict) -> None:
+@lru_cache(maxsize=200_000)
+def iso_normalize(s: str) -> Tuple[Optional[str], Optional[datetime]]:
     """
-    Create or update a Flight node with parsed attributes.
+    Parse a datetime string and return (canonical ISO 8601 string, datetime).
+    
+    Both values are None for empty/invalid strings. Memoized by input string
+    (bounded, like parse_iso8601_datetime_cached), so a timestamp repeated
+    across time columns is parsed and formatted only once; connection CSVs
+    repeat the same timestamps heavily, and the results are immutable.
+    """
+    dt = parse_dt(s)
+    return (dt.isoformat() if dt else None, dt)
+
+
+def build_flight_node_attributes(
+    flight_id: str,
+    prefix: str,
+    times: Dict[str, Tuple[Optional[str], Optional[datetime]]],
+    flight_fields: Optional[Tuple] = None
+) -> Optional[Dict]:
+    """
+    Build the attribute dict for a Flight node.
     
     Args:
-        G: NetworkX graph
         flight_id: Flight ID in format "WN1234_2026-01-01_ATL_LGA"
         prefix: "source" or "target" to pick appropriate time columns
-        row: CSV row dictionary
+        times: Row timestamps keyed by TIME_KEYS, as returned by iso_normalize
+        flight_fields: Pre-parsed parse_flight_id result (parsed here if omitted)
+    
+    Returns None without printing if the flight ID cannot be parsed;
+    callers decide how to report it (build_graph rejects such rows up front
+    and summarizes them once after loading).
     """
-    if not flight_id or flight_id not in G.nodes():
-        # Parse flight ID
-        carrier, flight_number, flight_date, origin, destination = parse_flight_id(flight_id)
-        
-        if not carrier or not flight_number:
-            print(f"  ⚠️  Skipping invalid flight ID: {flight_id}")
-            return
-        
-        # Get temporal attributes from row
-        sch_dep_key = f"{prefix}_flt_sch_dprt_gmt"
-        sch_arr_key = f"{prefix}_flt_sch_arr_gmt"
-        act_arr_key = f"{prefix}_flt_actl_arr_gmt"
-        
-        sch_dep_str = row.get(sch_dep_key, '').strip()
-        sch_arr_str = row.get(sch_arr_key, '').strip()
-        act_arr_str = row.get(act_arr_key, '').strip()
-        
-        # Parse datetimes
-        sch_dep = parse_dt(sch_dep_str)
-        sch_arr = parse_dt(sch_arr_str)
-        act_arr = parse_dt(act_arr_str)
-        
-        # Convert to ISO 8601 strings for storage
-        sch_dep_iso = sch_dep.isoformat() if sch_dep else None
-        sch_arr_iso = sch_arr.isoformat() if sch_arr else None
-        act_arr_iso = act_arr.isoformat() if act_arr else None
-        
-        # Create node attributes
-        node_attributes = {
-            'label': 'Flight',
-            'flight_id': flight_id,
-            'flight_number': flight_number,
-            'carrier': carrier,
-            'origin': origin,
-            'destination': destination,
-            'flight_date': flight_date,
-            'sch_dep_gmt': sch_dep_iso,
-            'sch_arr_gmt': sch_arr_iso,
-            'act_arr_gmt': act_arr_iso,
-        }
-        
-        # Remove None values
-        node_attributes = {k: v for k, v in node_attributes.items() if v is not None}
-        
-        G.add_node(flight_id, **node_attributes)
+    # Parse flight ID
+    if flight_fields is None:
+        flight_fields = parse_flight_id(flight_id)
+    carrier, flight_number, flight_date, origin, destination = flight_fields
+    
+    if not carrier or not flight_number:
+        return None
+    
+    # Get temporal attributes (already normalized to ISO 8601 strings)
+    sch_dep_iso, _ = times[f"{prefix}_flt_sch_dprt_gmt"]
+    sch_arr_iso, _ = times[f"{prefix}_flt_sch_arr_gmt"]
+    act_arr_iso, _ = times[f"{prefix}_flt_actl_arr_gmt"]
+    
+    # Create node attributes
+    node_attributes = {
+        'label': 'Flight',
+        'flight_id': flight_id,
+        'flight_number': flight_number,
+        'carrier': carrier,
+        'origin': origin,
+        'destination': destination,
+        'flight_date': flight_date,
+        'sch_dep_gmt': sch_dep_iso,
+        'sch_arr_gmt': sch_arr_iso,
+        'act_arr_gmt': act_arr_iso,
+    }
+    
+    # Remove None values
+    return {k: v for k, v in node_attributes.items() if v is not None}
 
 
 def get_edge_type_code(edge_code: str) -> str:
@@ -188,74 +231,71 @@ def get_edge_type_code(edge_code: str) -> str:
     return edge_type_map.get(edge_code_upper, f'UNKNOWN_{edge_code_upper}')
 
 
-def add_flight_connection_edge(
-    G: nx.MultiDiGraph,
+@lru_cache(maxsize=200_000)
+def get_edge_descriptor(edge_type: str, edge_label: str, edge_activity: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Edge key and non-temporal edge attributes for an edge code/label/activity.
+    
+    Most edges share the same few combinations, so the result is cached
+    (bounded, so one-off labels cannot grow it without limit) and its
+    strings interned: every edge reuses one set of string objects instead of
+    allocating its own copies. Callers must copy the attribute dict.
+    """
+    edge_type_full = get_edge_type_code(edge_type)
+    
+    # Create edge key: combination of edge type and label for uniqueness
+    edge_key = sys.intern(f"{edge_type_full}_{edge_label}")
+    
+    shared_attributes = {
+        'type': edge_type_full,
+        'edge_code': edge_type.strip().upper(),
+        'edge_label': edge_label.strip() if edge_label else '',
+        'edge_activity': edge_activity.strip() if edge_activity else '',
+    }
+    return edge_key, {k: sys.intern(v) for k, v in shared_attributes.items()}
+
+
+def build_connection_edge(
     src_flight_id: str,
     tgt_flight_id: str,
     edge_type: str,
     edge_label: str,
     edge_activity: str,
-    row: Dict
-) -> None:
+    times: Dict[str, Tuple[Optional[str], Optional[datetime]]]
+) -> Tuple[str, str, str, Dict]:
     """
-    Create typed edge from source Flight to target Flight.
+    Build a typed Flight -> Flight edge as a (src, tgt, key, attributes) tuple.
     
     Uses edge key (edge type + label) to support multiple parallel edges.
+    `times` holds the row's timestamps keyed by TIME_KEYS, parsed once per
+    row by build_graph, which also validates temporal consistency for all
+    rows at once.
     """
-    if not src_flight_id or not tgt_flight_id:
-        return
+    # Edge key and shared type/code/label/activity strings
+    edge_key, shared_attributes = get_edge_descriptor(edge_type, edge_label, edge_activity)
     
-    # Ensure both flight nodes exist
-    ensure_flight_node(G, src_flight_id, 'source', row)
-    ensure_flight_node(G, tgt_flight_id, 'target', row)
+    # Temporal attributes as ISO 8601 strings
+    source_sch_dep_iso, _ = times['source_flt_sch_dprt_gmt']
+    source_sch_arr_iso, _ = times['source_flt_sch_arr_gmt']
+    source_act_arr_iso, _ = times['source_flt_actl_arr_gmt']
+    target_sch_dep_iso, _ = times['target_flt_sch_dprt_gmt']
+    target_sch_arr_iso, _ = times['target_flt_sch_arr_gmt']
+    target_act_arr_iso, _ = times['target_flt_actl_arr_gmt']
     
-    # Get edge type code
-    edge_type_full = get_edge_type_code(edge_type)
-    
-    # Create edge key: combination of edge type and label for uniqueness
-    edge_key = f"{edge_type_full}_{edge_label}"
-    
-    # Get temporal attributes from row
-    source_sch_dep = row.get('source_flt_sch_dprt_gmt', '').strip()
-    source_sch_arr = row.get('source_flt_sch_arr_gmt', '').strip()
-    source_act_arr = row.get('source_flt_actl_arr_gmt', '').strip()
-    target_sch_dep = row.get('target_flt_sch_dprt_gmt', '').strip()
-    target_sch_arr = row.get('target_flt_sch_arr_gmt', '').strip()
-    target_act_arr = row.get('target_flt_actl_arr_gmt', '').strip()
-    
-    # Parse datetimes
-    source_sch_dep_dt = parse_dt(source_sch_dep)
-    source_sch_arr_dt = parse_dt(source_sch_arr)
-    source_act_arr_dt = parse_dt(source_act_arr)
-    target_sch_dep_dt = parse_dt(target_sch_dep)
-    target_sch_arr_dt = parse_dt(target_sch_arr)
-    target_act_arr_dt = parse_dt(target_act_arr)
-    
-    # Convert to ISO 8601 strings
     edge_attributes = {
-        'type': edge_type_full,
-        'edge_code': edge_type.strip().upper(),
-        'edge_label': edge_label.strip() if edge_label else '',
-        'edge_activity': edge_activity.strip() if edge_activity else '',
-        'source_flt_sch_dprt_gmt': source_sch_dep_dt.isoformat() if source_sch_dep_dt else None,
-        'source_flt_sch_arr_gmt': source_sch_arr_dt.isoformat() if source_sch_arr_dt else None,
-        'source_flt_actl_arr_gmt': source_act_arr_dt.isoformat() if source_act_arr_dt else None,
-        'target_flt_sch_dprt_gmt': target_sch_dep_dt.isoformat() if target_sch_dep_dt else None,
-        'target_flt_sch_arr_gmt': target_sch_arr_dt.isoformat() if target_sch_arr_dt else None,
-        'target_flt_actl_arr_gmt': target_act_arr_dt.isoformat() if target_act_arr_dt else None,
+        **shared_attributes,
+        'source_flt_sch_dprt_gmt': source_sch_dep_iso,
+        'source_flt_sch_arr_gmt': source_sch_arr_iso,
+        'source_flt_actl_arr_gmt': source_act_arr_iso,
+        'target_flt_sch_dprt_gmt': target_sch_dep_iso,
+        'target_flt_sch_arr_gmt': target_sch_arr_iso,
+        'target_flt_actl_arr_gmt': target_act_arr_iso,
     }
     
     # Remove None values
     edge_attributes = {k: v for k, v in edge_attributes.items() if v is not None}
     
-    # Validate temporal consistency: source arrival should be before target departure
-    if source_act_arr_dt and target_sch_dep_dt:
-        if source_act_arr_dt > target_sch_dep_dt:
-            print(f"  ⚠️  Warning: Temporal inconsistency for {src_flight_id} -> {tgt_flight_id}: "
-                  f"source arrives {source_act_arr_dt} but target departs {target_sch_dep_dt}")
-    
-    # Add edge with key for multigraph support
-    G.add_edge(src_flight_id, tgt_flight_id, key=edge_key, **edge_attributes)
+    return (src_flight_id, tgt_flight_id, edge_key, edge_attributes)
 
 
 def build_graph(csv_path: Path = None, model: str = "flights-only") -> nx.MultiDiGraph:
@@ -293,35 +333,129 @@ def build_graph(csv_path: Path = None, model: str = "flights-only") -> nx.MultiD
     
     # Load CSV
     edges_added = 0
-    errors = []
+    # Errors are counted per reason with a few example rows, then reported
+    # once after the loop
+    error_counts = Counter()
+    error_examples = []
+    
+    def record_error(row_num: int, reason: str, detail: str = '') -> None:
+        error_counts[reason] += 1
+        if len(error_examples) < 10:  # Keep the first 10 examples
+            error_examples.append(f"Row {row_num}: {reason}{detail}")
+    
+    # Nodes keyed by flight ID and (src, tgt, key, attributes) edge tuples,
+    # committed to the graph after the loop
+    nodes_buf = {}
+    edges_buf = []
+    
+    # Read the whole CSV in one pass; every column stays a string so the
+    # row checks below see the raw values
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False, encoding='utf-8')
+    
+    def column(name: str) -> pd.Series:
+        if name not in df.columns:
+            return pd.Series('', index=df.index)
+        return df[name].str.strip()
+    
+    # Timestamps repeat heavily across rows, so parse each distinct value
+    # once and map the (ISO string, datetime) results back onto the column
+    time_columns = []
+    datetime_columns = {}
+    for key in TIME_KEYS:
+        values = column(key)
+        parsed = {value: iso_normalize(value) for value in values.unique()}
+        time_columns.append(values.map(parsed))
+        datetime_columns[key] = pd.to_datetime(
+            values.map({value: dt for value, (_, dt) in parsed.items()}), utc=True
+        )
+    
+    # Each flight appears in several rows (as source and as target), so parse
+    # each distinct flight ID once with one regex pass and map the fields back
+    # onto both columns; IDs that do not match come back as all-NaN rows and
+    # are rejected in the loop below
+    source_ids = column('source_flt')
+    target_ids = column('target_flt')
+    unique_ids = pd.Index(pd.unique(pd.concat([source_ids, target_ids])))
+    id_fields = pd.Series(unique_ids, index=unique_ids).str.extract(FLIGHT_ID_PATTERN)
+    source_fields = id_fields.reindex(source_ids).reset_index(drop=True)
+    target_fields = id_fields.reindex(target_ids).reset_index(drop=True)
+    source_valid = source_fields['carrier'].notna()
+    target_valid = target_fields['carrier'].notna()
+    edge_codes = column('edge')
+    
+    # Validate temporal consistency column-wise: source arrival should be
+    # before target departure (missing timestamps compare as False)
+    source_act_arr = datetime_columns['source_flt_actl_arr_gmt']
+    target_sch_dep = datetime_columns['target_flt_sch_dprt_gmt']
+    inconsistent = (
+        (source_act_arr > target_sch_dep)
+        & (source_ids != '') & (target_ids != '')
+        & source_valid & target_valid & (edge_codes != '')
+    )
+    if inconsistent.any():
+        print(f"  ⚠️  Warning: {inconsistent.sum()} connection(s) with temporal inconsistencies:")
+        for src_flight_id, tgt_flight_id, source_arr, target_dep in list(zip(
+                source_ids[inconsistent], target_ids[inconsistent],
+                source_act_arr[inconsistent], target_sch_dep[inconsistent]))[:10]:  # Show first 10
+            print(f"    - {src_flight_id} -> {tgt_flight_id}: "
+                  f"source arrives {source_arr} but target departs {target_dep}")
+        if inconsistent.sum() > 10:
+            print(f"    ... and {inconsistent.sum() - 10} more")
+    
+    rows = zip(
+        source_ids,
+        target_ids,
+        source_valid,
+        target_valid,
+        source_fields.itertuples(index=False, name=None),
+        target_fields.itertuples(index=False, name=None),
+        edge_codes,
+        column('edge_label'),
+        column('edge_activity'),
+        *time_columns,
+    )
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-            try:
-                source_flt = row.get('source_flt', '').strip()
-                target_flt = row.get('target_flt', '').strip()
-                edge = row.get('edge', '').strip()
-                edge_label = row.get('edge_label', '').strip()
-                edge_activity = row.get('edge_activity', '').strip()
-                
-                if not source_flt or not target_flt:
-                    errors.append(f"Row {row_num}: Missing source_flt or target_flt")
-                    continue
-                
-                if not edge:
-                    errors.append(f"Row {row_num}: Missing edge code")
-                    continue
-                
-                # Add edge
-                add_flight_connection_edge(
-                    G, source_flt, target_flt, edge, edge_label, edge_activity, row
-                )
-                edges_added += 1
-                
-            except Exception as e:
-                errors.append(f"Row {row_num}: {e}")
+    for row_num, (source_flt, target_flt, src_valid, tgt_valid, src_fields, tgt_fields,
+                  edge, edge_label, edge_activity, *row_times) in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+        try:
+            if not source_flt or not target_flt:
+                record_error(row_num, "Missing source_flt or target_flt")
+                continue
+            
+            if not src_valid or not tgt_valid:
+                invalid_id = source_flt if not src_valid else target_flt
+                record_error(row_num, "Invalid flight ID format", f": {invalid_id}")
+                continue
+            
+            if not edge:
+                record_error(row_num, "Missing edge code")
+                continue
+            
+            # The row's timestamps, shared by both nodes and the edge
+            times = dict(zip(TIME_KEYS, row_times))
+            
+            # Buffer both flight nodes (first occurrence wins) and the edge
+            if source_flt not in nodes_buf:
+                node_attributes = build_flight_node_attributes(source_flt, 'source', times, src_fields)
+                if node_attributes is not None:
+                    nodes_buf[source_flt] = node_attributes
+            if target_flt not in nodes_buf:
+                node_attributes = build_flight_node_attributes(target_flt, 'target', times, tgt_fields)
+                if node_attributes is not None:
+                    nodes_buf[target_flt] = node_attributes
+            
+            edges_buf.append(build_connection_edge(
+                source_flt, target_flt, edge, edge_label, edge_activity, times
+            ))
+            edges_added += 1
+            
+        except Exception as e:
+            record_error(row_num, type(e).__name__, f": {e}")
+    
+    # Add all nodes, then all edges, in one call each to amortize NetworkX's
+    # per-call overhead; nodes first so every edge endpoint keeps its attributes
+    G.add_nodes_from(nodes_buf.items())
+    G.add_edges_from(edges_buf)
     
     # Print summary
     print(f"\n✅ Graph built successfully!")
@@ -329,30 +463,61 @@ def build_graph(csv_path: Path = None, model: str = "flights-only") -> nx.MultiD
     print(f"  🔗 Edges (Connections): {G.number_of_edges()}")
     print(f"  📈 Unique edges added: {edges_added}")
     
-    if errors:
-        print(f"\n⚠️  {len(errors)} errors encountered:")
-        for error in errors[:10]:  # Show first 10 errors
+    if error_counts:
+        print(f"\n⚠️  {sum(error_counts.values())} errors encountered:")
+        for reason, count in error_counts.most_common():
+            print(f"  - {reason}: {count} row(s)")
+        print("  Examples:")
+        for error in error_examples:
             print(f"  - {error}")
-        if len(errors) > 10:
-            print(f"  ... and {len(errors) - 10} more errors")
     
     return G
 
 
-def save_graph(G: nx.MultiDiGraph, output_path: Path) -> None:
+PICKLE_SUFFIXES = {'.pkl', '.pickle'}
+
+
+def detect_graph_format(path: Path) -> str:
+    """Infer the graph file format ('pickle' or 'json') from the file suffix."""
+    return 'pickle' if path.suffix.lower() in PICKLE_SUFFIXES else 'json'
+
+
+def save_graph(G: nx.MultiDiGraph, output_path: Path, format: Optional[str] = None) -> None:
     """
-    Save graph to JSON file using node-link format.
+    Save graph to a pickle or JSON node-link file.
+    
+    Args:
+        G: Graph to save
+        output_path: Destination path
+        format: 'pickle' or 'json'; inferred from the file suffix when omitted
+            (.pkl/.pickle -> pickle, anything else -> JSON node-link)
     
-    Compatible with NetworkX's node_link_data format.
+    Pickle stores the MultiDiGraph directly and is the fast path for repeated
+    save/load. JSON node-link format remains the interchange format.
     """
     print(f"\n💾 Saving graph to: {output_path}")
     
-    # Convert to node-link format
-    graph_data = nx.node_link_data(G)
+    if format is None:
+        format = detect_graph_format(output_path)
     
-    # Write to JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(graph_data, f, indent=2, ensure_ascii=False)
+    if format == 'pickle':
+        import pickle
+        
+        with open(output_path, 'wb') as f:
+            pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+    elif format == 'json':
+        # Convert to node-link format
+        graph_data = nx.node_link_data(G)
+        
+        # Write to JSON; orjson is much faster than the stdlib encoder
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(graph_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(graph_data, f, indent=2, ensure_ascii=False)
+    else:
+        raise ValueError(f"Unsupported graph format: {format} (expected 'pickle' or 'json')")
     
     print(f"  ✅ Graph saved successfully!")
     print(f"  📊 Nodes: {G.number_of_nodes()}")
@@ -360,10 +525,11 @@ def save_graph(G: nx.MultiDiGraph, output_path: Path) -> None:
     print(f"  📈 Model: {G.graph.get('model', 'unknown')}")
 
 
-def load_graph(file_path: Path) -> nx.MultiDiGraph:
+def load_graph(file_path: Path, format: Optional[str] = None) -> nx.MultiDiGraph:
     """
-    Load graph from JSON file.
+    Load graph from a pickle or JSON node-link file.
     
+    The format is inferred from the file suffix when not given.
     Returns NetworkX MultiDiGraph.
     """
     print(f"\n📂 Loading graph from: {file_path}")
@@ -371,11 +537,26 @@ def load_graph(file_path: Path) -> nx.MultiDiGraph:
     if not file_path.exists():
         raise FileNotFoundError(f"Graph file not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        graph_data = json.load(f)
+    if format is None:
+        format = detect_graph_format(file_path)
     
-    # Convert from node-link format
-    G = nx.node_link_graph(graph_data, directed=True, multigraph=True)
+    if format == 'pickle':
+        import pickle
+        
+        with open(file_path, 'rb') as f:
+            G = pickle.load(f)
+    elif format == 'json':
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                graph_data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                graph_data = json.load(f)
+        
+        # Convert from node-link format
+        G = nx.node_link_graph(graph_data, directed=True, multigraph=True)
+    else:
+        raise ValueError(f"Unsupported graph format: {format} (expected 'pickle' or 'json')")
     
     print(f"  ✅ Graph loaded successfully!")
     print(f"  📊 Nodes: {G.number_of_nodes()}")
@@ -408,13 +589,13 @@ def main():
         '--save',
         type=Path,
         default=None,
-        help='Save graph to JSON file (default: data/processed/ops_graph.json)'
+        help='Save graph to file, .pkl/.pickle for pickle, otherwise JSON (default: data/processed/ops_graph.json)'
     )
     parser.add_argument(
         '--load',
         type=Path,
         default=None,
-        help='Load graph from JSON file instead of building'
+        help='Load graph from a pickle or JSON file instead of building'
     )
     
     args = parser.parse_args()
@@ -10,7 +10,10 @@ Usage:
     streamlit run scripts/dashboard.py
 """
 
+import itertools
 import sys
+import weakref
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
@@ -39,12 +42,10 @@ except ImportError as e:
 # Import helper functions from example_usage.py
 try:
     from scripts.example_usage import (
-        parse_iso8601_datetime,
-        get_airport_state_at_time,
-        get_active_flights_at_time,
         get_events_in_window,
     )
     from scripts.build_graph import build_graph, load_graph
+    from scripts.load_sample_data import parse_iso8601_datetime_cached
 except ImportError as e:
     st.error(f"❌ Error importing helper modules: {e}")
     st.stop()
@@ -65,80 +66,400 @@ st.set_page_config(
 # Graph Loading and Caching
 # ============================================================================
 
-@st.cache_data
+@st.cache_resource
 def load_or_build_graph(graph_file: Optional[Path] = None, data_dir: Optional[Path] = None):
     """
     Load graph from file or build from CSV data.
-    Cached by Streamlit to avoid rebuilding on every rerun.
+    Cached by Streamlit to avoid rebuilding on every rerun. The graph is
+    cached as a shared resource (no pickle copy per rerun), so the
+    dashboard must treat it as read-only.
     """
     if graph_file and graph_file.exists():
-        return load_graph(graph_file)
+        G = load_graph(graph_file)
+        add_edge_timestamps(G)
+        return G
     else:
         return build_graph(data_dir)
 
 
-def get_time_range(G: nx.MultiDiGraph) -> Tuple[Optional[datetime], Optional[datetime]]:
-    """Get the first departure and last arrival times from the graph."""
-    first_departure = None
-    last_arrival = None
+# Cache keys handed out by get_graph_cache_key, keyed weakly by graph object
+_GRAPH_CACHE_KEYS = weakref.WeakKeyDictionary()
+_next_graph_cache_key = itertools.count(1)
+
+
+def get_graph_cache_key(G: nx.MultiDiGraph) -> int:
+    """
+    Key identifying a loaded graph in Streamlit caches.
+    
+    Hashing the whole graph would cost as much as the work being cached, and
+    load_or_build_graph shares one graph object per source, so caches of
+    derived data hash graphs by object instead: each graph gets a number the
+    first time it is hashed. Unlike id(G) the number is never reused by a
+    later graph, and unlike a size/time-bounds fingerprint no two different
+    graphs share it.
+    """
+    key = _GRAPH_CACHE_KEYS.get(G)
+    if key is None:
+        key = _GRAPH_CACHE_KEYS.setdefault(G, next(_next_graph_cache_key))
+    return key
+
+
+# Streamlit cache options for functions taking the graph as an argument
+GRAPH_HASH_FUNCS = {nx.MultiDiGraph: get_graph_cache_key}
+
+
+def get_edge_timestamps(data: Dict) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Effective (departure, arrival) of a flight edge as POSIX seconds.
+    
+    Actual gate times take precedence over scheduled ones. Uses the _dep_ts /
+    _arr_ts values cached on the edge by build_graph, and only parses the ISO
+    strings for edges without them (graphs loaded from a file, since
+    save_graph does not write them).
+    """
+    dep_ts = data.get('_dep_ts')
+    if dep_ts is None:
+        dep_time = parse_iso8601_datetime_cached(data.get('actual_departure_gate') or data.get('scheduled_departure_gate'))
+        dep_ts = dep_time.timestamp() if dep_time else None
+    
+    arr_ts = data.get('_arr_ts')
+    if arr_ts is None:
+        arr_time = parse_iso8601_datetime_cached(data.get('actual_arrival_gate') or data.get('scheduled_arrival_gate'))
+        arr_ts = arr_time.timestamp() if arr_time else None
+    
+    return dep_ts, arr_ts
+
+
+def add_edge_timestamps(G: nx.MultiDiGraph) -> None:
+    """
+    Cache _dep_ts / _arr_ts on the edges of a graph loaded from a file.
+    
+    Parses each edge's gate times once at load time, so later queries
+    never fall back to parsing ISO strings. Edges that already have both
+    values are left untouched.
+    """
+    for _, _, data in G.edges(data=True):
+        if '_dep_ts' in data and '_arr_ts' in data:
+            continue
+        dep_ts, arr_ts = get_edge_timestamps(data)
+        if dep_ts is not None:
+            data['_dep_ts'] = dep_ts
+        if arr_ts is not None:
+            data['_arr_ts'] = arr_ts
+
+
+# Edge tables built by get_edge_table, keyed weakly by graph so they are
+# dropped together with the graph and never end up in a saved graph file
+_EDGE_TABLES = weakref.WeakKeyDictionary()
+
+
+def get_edge_table(G: nx.MultiDiGraph) -> pd.DataFrame:
+    """
+    Column-oriented table of the graph's flight edges for analytical queries.
+    
+    One row per edge in G.edges order, with columns origin, destination,
+    edge_key, flight_id, carrier, flight_number, dep_ts and arr_ts (POSIX
+    seconds, NaN when unknown), departure_delay and arrival_delay (as stored,
+    0 when absent). origin and destination are categoricals over the sorted
+    airport codes, so their category codes are rows of get_airport_table(G).
+    Built once per graph object and reused by every query. NetworkX remains
+    the topology store; this is only an accelerator.
+    """
+    table = _EDGE_TABLES.get(G)
+    if table is not None:
+        return table
     
+    rows = []
     for origin, destination, key, data in G.edges(data=True, keys=True):
-        dep_time_str = data.get('actual_departure_gate') or data.get('scheduled_departure_gate')
-        arr_time_str = data.get('actual_arrival_gate') or data.get('scheduled_arrival_gate')
-        
-        if dep_time_str:
-            dep_time = parse_iso8601_datetime(dep_time_str)
-            if dep_time and (first_departure is None or dep_time < first_departure):
-                first_departure = dep_time
-        
-        if arr_time_str:
-            arr_time = parse_iso8601_datetime(arr_time_str)
-            if arr_time and (last_arrival is None or arr_time > last_arrival):
-                last_arrival = arr_time
+        dep_ts, arr_ts = get_edge_timestamps(data)
+        rows.append((
+            origin,
+            destination,
+            key,
+            data.get('flight_id', 'unknown'),
+            data.get('carrier', ''),
+            data.get('flight_number', ''),
+            np.nan if dep_ts is None else dep_ts,
+            np.nan if arr_ts is None else arr_ts,
+            data.get('departure_delay_minutes', 0),
+            data.get('arrival_delay_minutes', 0),
+        ))
     
-    return first_departure, last_arrival
+    table = pd.DataFrame.from_records(rows, columns=[
+        'origin', 'destination', 'edge_key', 'flight_id', 'carrier', 'flight_number',
+        'dep_ts', 'arr_ts', 'departure_delay', 'arrival_delay',
+    ])
+    # Keep delays as stored (Python ints) rather than letting pandas upcast them
+    table['departure_delay'] = table['departure_delay'].astype(object)
+    table['arrival_delay'] = table['arrival_delay'].astype(object)
+    table['dep_ts'] = table['dep_ts'].astype(np.float64)
+    table['arr_ts'] = table['arr_ts'].astype(np.float64)
+    # Store airport codes once per airport rather than once per edge
+    airport_dtype = pd.CategoricalDtype(sorted(G.nodes()))
+    table['origin'] = table['origin'].astype(airport_dtype)
+    table['destination'] = table['destination'].astype(airport_dtype)
+    
+    _EDGE_TABLES[G] = table
+    return table
+
+
+def sort_events_by_time(event_seconds: np.ndarray, raw_delays: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorted event times (unknown times dropped) and running delay totals.
+    
+    The totals array has one extra leading 0, so totals[count_events_up_to(...)]
+    is the delay accumulated at or before each grid point. Missing delays
+    count as 0 and non-numeric delays add nothing. The sort is stable, so
+    events at the same time keep their edge order.
+    """
+    known = ~np.isnan(event_seconds)
+    order = np.argsort(event_seconds[known], kind='stable')
+    delays = pd.to_numeric(raw_delays.fillna(0), errors='coerce').to_numpy(dtype=np.float64)
+    delay_totals = np.concatenate(([0.0], np.cumsum(np.nan_to_num(delays[known][order], nan=0.0))))
+    return event_seconds[known][order], delay_totals
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_event_arrays(G: nx.MultiDiGraph) -> Dict[str, np.ndarray]:
+    """
+    Sorted event-time arrays behind the timeline charts.
+    
+    Returns departure_seconds / arrival_seconds (sorted POSIX seconds) with
+    their running departure_delay_totals / arrival_delay_totals (see
+    sort_events_by_time), plus the sorted departure and arrival times of
+    flights that can be enroute. Cached by Streamlit per loaded graph object
+    (see get_graph_cache_key), so the O(E) scan runs once, not per slider
+    drag, and another graph of the same size never gets these arrays.
+    """
+    edge_table = get_edge_table(G)
+    dep_ts = edge_table['dep_ts'].to_numpy()
+    arr_ts = edge_table['arr_ts'].to_numpy()
+    
+    departure_seconds, departure_delay_totals = sort_events_by_time(dep_ts, edge_table['departure_delay'])
+    arrival_seconds, arrival_delay_totals = sort_events_by_time(arr_ts, edge_table['arrival_delay'])
+    
+    # Flights that never satisfy dep <= t < arr are never enroute
+    # (NaN comparisons are False, so flights missing either time drop out)
+    enroute_possible = dep_ts < arr_ts
+    
+    return {
+        'departure_seconds': departure_seconds,
+        'departure_delay_totals': departure_delay_totals,
+        'arrival_seconds': arrival_seconds,
+        'arrival_delay_totals': arrival_delay_totals,
+        'enroute_departure_seconds': np.sort(dep_ts[enroute_possible]),
+        'enroute_arrival_seconds': np.sort(arr_ts[enroute_possible]),
+    }
+
+
+# Active flight counts per origin airport by query time, per graph object
+# (see get_active_origin_counts)
+_ACTIVE_ORIGIN_COUNTS = weakref.WeakKeyDictionary()
+_ACTIVE_FLIGHTS_MAX_TIMES = 256
+
+
+def _memoize_by_time(cache: weakref.WeakKeyDictionary, G: nx.MultiDiGraph, current_time: datetime, compute):
+    """
+    Return compute() memoized in cache under (G, current_time).
+    
+    The graph is shared by all sessions, so another session may clear the
+    per-graph dict at any time; results are returned from a local, never
+    re-read from the dict.
+    """
+    by_time = cache.setdefault(G, {})
+    value = by_time.get(current_time)
+    if value is None:
+        value = compute()
+        if len(by_time) >= _ACTIVE_FLIGHTS_MAX_TIMES:
+            by_time.clear()
+        by_time[current_time] = value
+    return value
+
+
+def count_active_origins(G: nx.MultiDiGraph, current_time: datetime) -> Counter:
+    """
+    Count flights in the air (departure <= current_time < arrival) per origin.
+    
+    One vectorized comparison over the edge table's departure/arrival
+    seconds selects the active flights; flights missing either time never
+    match.
+    """
+    edge_table = get_edge_table(G)
+    current_ts = current_time.timestamp()
+    active = (edge_table['dep_ts'] <= current_ts) & (current_ts < edge_table['arr_ts'])
+    origin_counts = edge_table['origin'][active].value_counts()
+    return Counter(origin_counts[origin_counts > 0].to_dict())
+
+
+def get_active_origin_counts(G: nx.MultiDiGraph, current_time: datetime) -> Counter:
+    """
+    Number of active flights per origin airport at current_time.
+    
+    Counted once per graph object and time, so the network map and the
+    airport status table share it and looking up one airport is O(1).
+    The shared result must not be modified.
+    """
+    return _memoize_by_time(_ACTIVE_ORIGIN_COUNTS, G, current_time,
+                            lambda: count_active_origins(G, current_time))
+
+
+# Airport snapshot times by airport, per graph object (see get_airport_states_at_time)
+_AIRPORT_SNAPSHOT_INDEXES = weakref.WeakKeyDictionary()
+
+
+def get_airport_snapshot_index(G: nx.MultiDiGraph) -> Dict[str, Tuple[np.ndarray, List[Dict]]]:
+    """
+    Each airport's snapshot times (POSIX seconds) and cumulative states.
+    
+    Airports without snapshots are left out. Times are the running maximum
+    of the snapshot times, and snapshots after one whose time cannot be
+    parsed are dropped, so a binary search reproduces the early exit in
+    get_airport_state_at_time. Built once per graph object; only the lookup
+    depends on the replay time.
+    """
+    index = _AIRPORT_SNAPSHOT_INDEXES.get(G)
+    if index is not None:
+        return index
+    
+    index = {}
+    for airport_code, node_data in G.nodes(data=True):
+        if not node_data.get('time_snapshots'):
+            continue
+        snapshot_seconds = []
+        cumulative_states = []
+        for snapshot in node_data['time_snapshots']:
+            snapshot_time_str = snapshot.get('timestamp', '')
+            if not snapshot_time_str:
+                continue
+            snapshot_time = parse_iso8601_datetime_cached(snapshot_time_str)
+            if not snapshot_time:
+                break
+            snapshot_seconds.append(snapshot_time.timestamp())
+            cumulative_states.append(snapshot['cumulative'])
+        index[airport_code] = (np.maximum.accumulate(np.array(snapshot_seconds, dtype=np.float64)), cumulative_states)
+    
+    _AIRPORT_SNAPSHOT_INDEXES[G] = index
+    return index
+
+
+def get_airport_states_at_time(G: nx.MultiDiGraph, airport_codes, current_time: datetime) -> List[Optional[Dict]]:
+    """
+    get_airport_state_at_time for each airport, looked up by binary search.
+    
+    None for airports without snapshots, zeros before an airport's first
+    snapshot, otherwise the cumulative state of its last snapshot at or
+    before current_time. The returned states must not be modified.
+    """
+    index = get_airport_snapshot_index(G)
+    current_ts = current_time.timestamp()
+    states = []
+    for airport_code in airport_codes:
+        if airport_code not in index:
+            states.append(None)
+            continue
+        snapshot_seconds, cumulative_states = index[airport_code]
+        count = np.searchsorted(snapshot_seconds, current_ts, side='right')
+        states.append(cumulative_states[count - 1] if count else {
+            'total_departures': 0,
+            'total_arrivals': 0,
+            'avg_departure_delay': 0.0,
+            'avg_arrival_delay': 0.0,
+            'on_time_departure_pct': 0.0,
+            'on_time_arrival_pct': 0.0
+        })
+    return states
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_time_range(G: nx.MultiDiGraph) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Get the first departure and last arrival times from the graph.
+    
+    Returns the datetime bounds recorded in G.graph by build_graph as they
+    are. Graphs loaded from a file (save_graph does not write the bounds, and
+    older files hold them as strings) fall back to a vectorized min/max over
+    the edge table, done once per loaded graph rather than on every rerun.
+    """
+    first_departure = G.graph.get('first_departure')
+    last_arrival = G.graph.get('last_arrival')
+    if isinstance(first_departure, datetime) and isinstance(last_arrival, datetime):
+        return first_departure, last_arrival
+    
+    edge_table = get_edge_table(G)
+    first_departure = edge_table['dep_ts'].min()
+    last_arrival = edge_table['arr_ts'].max()
+    
+    return (
+        datetime.fromtimestamp(first_departure, timezone.utc) if pd.notna(first_departure) else None,
+        datetime.fromtimestamp(last_arrival, timezone.utc) if pd.notna(last_arrival) else None,
+    )
 
 
 # ============================================================================
 # Data Query Functions
 # ============================================================================
 
+def build_time_grid(start_time: datetime, end_time: datetime, interval_minutes: int = 1) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """
+    Regular time grid from start_time to end_time (inclusive) for timeline charts.
+    
+    Returns the grid as a DatetimeIndex (for the chart's time column) and as
+    POSIX seconds (for np.searchsorted against sorted event times). Both are
+    built without a per-step Python loop; the seconds come from integer
+    microseconds, so they equal datetime.timestamp() exactly.
+    """
+    interval = timedelta(minutes=interval_minutes)
+    steps = (end_time - start_time) // interval + 1 if end_time >= start_time else 0
+    times = pd.date_range(start_time, periods=steps, freq=interval).as_unit('us')
+    grid_seconds = times.asi8 / 1e6
+    return times, grid_seconds
+
+
+def count_events_up_to(event_seconds: np.ndarray, grid_seconds: np.ndarray) -> np.ndarray:
+    """Number of events at or before each grid point (event_seconds must be sorted)."""
+    return np.searchsorted(event_seconds, grid_seconds, side='right')
+
+
 def get_completed_flights_up_to_time(G: nx.MultiDiGraph, target_time: datetime) -> List[Dict]:
     """Get flights that have arrived by target time."""
-    completed_flights = []
-    
-    for origin, destination, key, data in G.edges(data=True, keys=True):
-        arr_time_str = data.get('actual_arrival_gate') or data.get('scheduled_arrival_gate')
-        
-        if arr_time_str:
-            arr_time = parse_iso8601_datetime(arr_time_str)
-            if arr_time and arr_time <= target_time:
-                completed_flights.append({
-                    'flight_id': data.get('flight_id', 'unknown'),
-                    'origin': origin,
-                    'destination': destination,
-                    'arrival': arr_time,
-                    'carrier': data.get('carrier', ''),
-                    'flight_number': data.get('flight_number', ''),
-                    'departure_delay': data.get('departure_delay_minutes', 0),
-                    'arrival_delay': data.get('arrival_delay_minutes', 0),
-                    'edge_key': key
-                })
-    
-    return completed_flights
+    edge_table = get_edge_table(G)
+    completed = edge_table[edge_table['arr_ts'] <= target_time.timestamp()]
+    
+    return [
+        {
+            'flight_id': flight_id,
+            'origin': origin,
+            'destination': destination,
+            'arrival': datetime.fromtimestamp(arr_ts, timezone.utc),
+            'carrier': carrier,
+            'flight_number': flight_number,
+            'departure_delay': departure_delay,
+            'arrival_delay': arrival_delay,
+            'edge_key': key
+        }
+        for origin, destination, key, flight_id, carrier, flight_number, arr_ts, departure_delay, arrival_delay
+        in zip(
+            completed['origin'], completed['destination'], completed['edge_key'],
+            completed['flight_id'], completed['carrier'], completed['flight_number'],
+            completed['arr_ts'], completed['departure_delay'], completed['arrival_delay'],
+        )
+    ]
 
 
 def get_flights_enroute_over_time(G: nx.MultiDiGraph, start_time: datetime, end_time: datetime, interval_minutes: int = 1) -> pd.DataFrame:
-    """Get time series of flights enroute count at regular intervals."""
-    times = []
-    enroute_counts = []
+    """Get time series of flights enroute count at regular intervals.
     
-    current_time = start_time
-    while current_time <= end_time:
-        active_flights = get_active_flights_at_time(G, current_time)
-        enroute_counts.append(len(active_flights))
-        times.append(current_time)
-        current_time += timedelta(minutes=interval_minutes)
+    Sweep-line approach: a flight is enroute while departure <= t < arrival,
+    so the count at t is (departures <= t) - (arrivals <= t). Both counts
+    come from one np.searchsorted pass over the sorted event times, instead
+    of scanning every edge at every interval.
+    """
+    event_arrays = get_event_arrays(G)
+    
+    times, grid_seconds = build_time_grid(start_time, end_time, interval_minutes)
+    enroute_counts = (
+        count_events_up_to(event_arrays['enroute_departure_seconds'], grid_seconds)
+        - count_events_up_to(event_arrays['enroute_arrival_seconds'], grid_seconds)
+    )
     
     return pd.DataFrame({
         'time': times,
@@ -152,48 +473,17 @@ def get_cumulative_delay_over_time(G: nx.MultiDiGraph, start_time: datetime, end
     Args:
         delay_type: 'departure' for departure delays, 'arrival' for arrival delays
     """
-    times = []
-    cumulative_delays = []
-    
-    # Pre-compute all flights with their delays and times
-    flights_data = []
-    for origin, destination, key, data in G.edges(data=True, keys=True):
-        if delay_type == 'departure':
-            time_str = data.get('actual_departure_gate') or data.get('scheduled_departure_gate')
-            delay = data.get('departure_delay_minutes', 0) or 0
-        else:  # arrival
-            time_str = data.get('actual_arrival_gate') or data.get('scheduled_arrival_gate')
-            delay = data.get('arrival_delay_minutes', 0) or 0
-        
-        if time_str:
-            flight_time = parse_iso8601_datetime(time_str)
-            if flight_time and delay is not None:
-                try:
-                    delay_float = float(delay)
-                    flights_data.append({
-                        'time': flight_time,
-                        'delay': delay_float
-                    })
-                except (ValueError, TypeError):
-                    pass
-    
-    # Sort by time
-    flights_data.sort(key=lambda x: x['time'])
-    
-    # Build cumulative sum
-    current_time = start_time
-    cumulative_delay = 0.0
-    flight_idx = 0
-    
-    while current_time <= end_time:
-        # Add delays for flights that have completed by current_time
-        while flight_idx < len(flights_data) and flights_data[flight_idx]['time'] <= current_time:
-            cumulative_delay += flights_data[flight_idx]['delay']
-            flight_idx += 1
-        
-        times.append(current_time)
-        cumulative_delays.append(cumulative_delay)
-        current_time += timedelta(minutes=interval_minutes)
+    event_arrays = get_event_arrays(G)
+    if delay_type == 'departure':
+        flight_seconds = event_arrays['departure_seconds']
+        delay_totals = event_arrays['departure_delay_totals']
+    else:  # arrival
+        flight_seconds = event_arrays['arrival_seconds']
+        delay_totals = event_arrays['arrival_delay_totals']
+    
+    # Look up the running total of delays at or before each grid point
+    times, grid_seconds = build_time_grid(start_time, end_time, interval_minutes)
+    cumulative_delays = delay_totals[count_events_up_to(flight_seconds, grid_seconds)]
     
     # Use different column names based on delay type
     column_name = 'cumulative_outbound_delay' if delay_type == 'departure' else 'cumulative_inbound_delay'
@@ -204,6 +494,34 @@ def get_cumulative_delay_over_time(G: nx.MultiDiGraph, start_time: datetime, end
     })
 
 
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_volume_chart_data(G: nx.MultiDiGraph, start_time: datetime, end_time: datetime, interval_minutes: int = 1) -> pd.DataFrame:
+    """
+    Flights enroute and cumulative delays on one time grid, ready to plot.
+    
+    Values are coerced to numbers (missing as 0) here, once per graph and
+    time range, and the axis maxima (at least 1) are stored in
+    df.attrs['y_max_left'] and df.attrs['y_max_right'], so
+    create_flight_volume_chart does no column work on slider moves.
+    """
+    enroute_df = get_flights_enroute_over_time(G, start_time, end_time, interval_minutes)
+    outbound_delay_df = get_cumulative_delay_over_time(G, start_time, end_time, interval_minutes, delay_type='departure')
+    inbound_delay_df = get_cumulative_delay_over_time(G, start_time, end_time, interval_minutes, delay_type='arrival')
+    
+    # All three series are sampled on the same time grid, so line them
+    # up on it directly (columns are already correctly named)
+    df = pd.concat(
+        [frame.set_index('time') for frame in (enroute_df, outbound_delay_df, inbound_delay_df)],
+        axis=1,
+    ).apply(pd.to_numeric, errors='coerce').fillna(0).reset_index()
+    
+    # Enroute count on the left axis, both delay series on the right
+    df.attrs['y_max_left'] = max(float(df['flights_enroute'].max()), 1.0) if len(df) else 1.0
+    delay_values = df[['cumulative_outbound_delay', 'cumulative_inbound_delay']].to_numpy()
+    df.attrs['y_max_right'] = max(float(delay_values.max()), 1.0) if delay_values.size else 1.0
+    return df
+
+
 def get_airport_coordinates(G: nx.MultiDiGraph) -> Dict[str, Tuple[float, float]]:
     """Get dictionary mapping airport codes to (latitude, longitude) tuples."""
     coords = {}
@@ -219,71 +537,184 @@ def get_airport_coordinates(G: nx.MultiDiGraph) -> Dict[str, Tuple[float, float]
     return coords
 
 
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_airport_table(G: nx.MultiDiGraph) -> pd.DataFrame:
+    """
+    One row per airport node, sorted by code, for the map views.
+    
+    Columns: code, airport_name (the code when missing), lat and lon (NaN
+    when missing or invalid) and has_coords. Built once per loaded graph so
+    renders do not sort the nodes and look up node attributes every time.
+    """
+    airport_coords = get_airport_coordinates(G)
+    airport_codes = sorted(G.nodes())
+    return pd.DataFrame({
+        'code': airport_codes,
+        'airport_name': [G.nodes[airport_code].get('airport_name', airport_code) for airport_code in airport_codes],
+        'lat': [airport_coords[airport_code][0] if airport_code in airport_coords else np.nan for airport_code in airport_codes],
+        'lon': [airport_coords[airport_code][1] if airport_code in airport_coords else np.nan for airport_code in airport_codes],
+        'has_coords': [airport_code in airport_coords for airport_code in airport_codes],
+    })
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_edge_arrays(G: nx.MultiDiGraph) -> Dict[str, np.ndarray]:
+    """
+    The flight edge fields the network map scans, as compact parallel arrays.
+    
+    Only flights the map can draw are kept: both gate times known and both
+    airports with coordinates. origin_idx / dest_idx are int32 row numbers
+    into get_airport_table(G); dep_ts / arr_ts are POSIX seconds, kept as
+    float64 since float32 cannot hold them to the second. route_idx numbers
+    each edge's (origin, destination) route in order of first appearance,
+    with route_origin_idx / route_dest_idx giving each route's airports.
+    Built once per loaded graph, so each render only does array operations.
+    """
+    edge_table = get_edge_table(G)
+    airport_table = get_airport_table(G)
+    n_airports = len(airport_table)
+    origin_idx = edge_table['origin'].cat.codes.to_numpy().astype(np.int32)
+    dest_idx = edge_table['destination'].cat.codes.to_numpy().astype(np.int32)
+    dep_ts = edge_table['dep_ts'].to_numpy(dtype=np.float64)
+    arr_ts = edge_table['arr_ts'].to_numpy(dtype=np.float64)
+    
+    # Drop flights that can never appear on the map, so renders skip them
+    airport_has_coords = airport_table['has_coords'].to_numpy(dtype=bool)
+    mappable = (
+        ~np.isnan(dep_ts) & ~np.isnan(arr_ts)
+        & airport_has_coords[origin_idx]
+        & airport_has_coords[dest_idx]
+    )
+    origin_idx, dest_idx = origin_idx[mappable], dest_idx[mappable]
+    dep_ts, arr_ts = dep_ts[mappable], arr_ts[mappable]
+    
+    # Number the routes by factorizing one integer per (origin, destination) pair
+    route_idx, route_pairs = pd.factorize(origin_idx.astype(np.int64) * n_airports + dest_idx)
+    
+    return {
+        'origin_idx': origin_idx,
+        'dest_idx': dest_idx,
+        'dep_ts': dep_ts,
+        'arr_ts': arr_ts,
+        'route_idx': route_idx.astype(np.int32),
+        'route_origin_idx': (route_pairs // n_airports).astype(np.int32),
+        'route_dest_idx': (route_pairs % n_airports).astype(np.int32),
+    }
+
+
 def get_flight_volume_timeline(G: nx.MultiDiGraph, start_time: datetime, end_time: datetime, interval_minutes: int = 1) -> pd.DataFrame:
     """Extract flight volume data at regular intervals for timeline chart.
     
     Optimized approach: Pre-compute all departure and arrival times from edges,
-    then count events at each time interval.
+    then count events at each time interval with np.searchsorted.
     """
-    # Pre-compute all departure and arrival times
-    departure_times = []
-    arrival_times = []
+    # Departure and arrival times, sorted once per loaded graph
+    event_arrays = get_event_arrays(G)
     
-    for origin, destination, key, data in G.edges(data=True, keys=True):
-        dep_time_str = data.get('actual_departure_gate') or data.get('scheduled_departure_gate')
-        arr_time_str = data.get('actual_arrival_gate') or data.get('scheduled_arrival_gate')
-        
-        if dep_time_str:
-            dep_time = parse_iso8601_datetime(dep_time_str)
-            if dep_time:
-                departure_times.append(dep_time)
-        
-        if arr_time_str:
-            arr_time = parse_iso8601_datetime(arr_time_str)
-            if arr_time:
-                arrival_times.append(arr_time)
-    
-    # Sort times for efficient lookup
-    departure_times.sort()
-    arrival_times.sort()
-    
-    # Build timeline by counting events up to each time point
-    times = []
-    departure_counts = []
-    arrival_counts = []
-    
-    current_time = start_time
-    dep_idx = 0  # Index into sorted departure_times
-    arr_idx = 0  # Index into sorted arrival_times
-    
-    while current_time <= end_time:
-        # Count departures that have occurred by current_time
-        # Advance index while departures are <= current_time
-        while dep_idx < len(departure_times) and departure_times[dep_idx] <= current_time:
-            dep_idx += 1
-        # dep_idx now points to the first departure after current_time
-        # So dep_idx is the count of departures <= current_time
-        departures = dep_idx
-        
-        # Count arrivals that have occurred by current_time
-        # Advance index while arrivals are <= current_time
-        while arr_idx < len(arrival_times) and arrival_times[arr_idx] <= current_time:
-            arr_idx += 1
-        # arr_idx now points to the first arrival after current_time
-        # So arr_idx is the count of arrivals <= current_time
-        arrivals = arr_idx
-        
-        times.append(current_time)
-        departure_counts.append(departures)
-        arrival_counts.append(arrivals)
-        
-        current_time += timedelta(minutes=interval_minutes)
+    times, grid_seconds = build_time_grid(start_time, end_time, interval_minutes)
+    departure_counts = count_events_up_to(event_arrays['departure_seconds'], grid_seconds)
+    arrival_counts = count_events_up_to(event_arrays['arrival_seconds'], grid_seconds)
     
     return pd.DataFrame({
         'time': times,
         'departures': departure_counts,
         'arrivals': arrival_counts,
-        'total_flights': [d + a for d, a in zip(departure_counts, arrival_counts)]
+        'total_flights': departure_counts + arrival_counts
+    })
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_flight_index(G: nx.MultiDiGraph) -> Dict[str, Tuple]:
+    """
+    Map each flight_id to (origin, destination, departure delay, arrival delay).
+    
+    Delays are as stored on the edge (0 when absent). When several edges
+    share a flight_id the first one in G.edges order wins. Built once per
+    loaded graph, so the event timeline looks flights up in O(1) instead
+    of scanning every edge per event.
+    """
+    flight_index = {}
+    for origin, destination, data in G.edges(data=True):
+        if 'flight_id' in data:
+            flight_index.setdefault(data['flight_id'], (
+                origin,
+                destination,
+                data.get('departure_delay_minutes', 0),
+                data.get('arrival_delay_minutes', 0),
+            ))
+    return flight_index
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_sorted_events(G: nx.MultiDiGraph) -> Tuple[List[Dict], np.ndarray]:
+    """
+    Every airport snapshot event, sorted by time, with its POSIX seconds.
+    
+    Same event records as example_usage.get_events_in_window over the whole
+    simulation. Collected and sorted once per loaded graph, so any time
+    window is then a binary search (see get_events_between).
+    """
+    events = get_events_in_window(G, datetime.min.replace(tzinfo=timezone.utc), datetime.max.replace(tzinfo=timezone.utc))
+    event_seconds = np.array([event['timestamp'].timestamp() for event in events], dtype=np.float64)
+    return events, event_seconds
+
+
+def get_events_between(G: nx.MultiDiGraph, start_time: datetime, end_time: datetime) -> List[Dict]:
+    """Events with start_time <= timestamp <= end_time, in time order (like get_events_in_window)."""
+    events, event_seconds = get_sorted_events(G)
+    first = np.searchsorted(event_seconds, start_time.timestamp(), side='left')
+    last = np.searchsorted(event_seconds, end_time.timestamp(), side='right')
+    return events[first:last]
+
+
+def format_timestamps(timestamps: pd.Series, fmt: str) -> pd.Series:
+    """strftime every timestamp in the column ('' for missing ones), each in its own UTC offset."""
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps.dt.strftime(fmt).fillna('')
+    # Mixed UTC offsets leave an object column, formatted one by one
+    return timestamps.map(lambda t: t.strftime(fmt) if t else '')
+
+
+def build_events_table(events: List[Dict], flight_index: Dict[str, Tuple]) -> pd.DataFrame:
+    """
+    Event timeline table: one row per event with its flight's route and delay.
+    
+    Events are joined to flights through get_flight_index. Delay is the
+    departure or arrival delay matching the event type (0 when missing or
+    not numeric, or when the flight is unknown), and Status classifies it:
+    negative is early, 0 on-time, up to 30 min late, above that
+    significantly late. Built with column operations rather than per event.
+    """
+    events_df = pd.DataFrame.from_records(events, columns=['airport', 'timestamp', 'event_type', 'flight_id'])
+    flights = pd.DataFrame.from_dict(
+        flight_index, orient='index',
+        columns=['origin', 'destination', 'departure_delay', 'arrival_delay'],
+    ).reindex(events_df['flight_id'])
+    found = flights['origin'].notna().to_numpy()
+    
+    event_type = events_df['event_type'].str.lower()
+    is_departure = (event_type == 'departure').to_numpy()
+    is_arrival = (event_type == 'arrival').to_numpy()
+    
+    # Delay matching the event type, as a float
+    raw_delay = np.where(is_departure, flights['departure_delay'], np.where(is_arrival, flights['arrival_delay'], 0))
+    delay = np.where(found, pd.to_numeric(pd.Series(raw_delay), errors='coerce').fillna(0.0), 0.0)
+    
+    # Status labels name the direction when the event type is known
+    early = np.select([is_departure, is_arrival], ['Early Departure', 'Early Arrival'], 'Early')
+    late = np.select([is_departure, is_arrival], ['Late Departing', 'Late Arriving'], 'Late')
+    very_late = np.select([is_departure, is_arrival], ['Significantly Late Departing', 'Significantly Late Arriving'], 'Significantly Late')
+    status = np.select([delay < 0, delay == 0, delay <= 30], [early, 'On-Time', late], very_late)
+    
+    return pd.DataFrame({
+        'Timestamp': format_timestamps(events_df['timestamp'], '%Y-%m-%d %H:%M:%S UTC'),
+        'Time': format_timestamps(events_df['timestamp'], '%H:%M:%S'),
+        'Event Type': event_type.str.upper(),
+        'Airport': events_df['airport'],
+        'Flight ID': events_df['flight_id'],
+        'Route': np.where(found, flights['origin'].astype(str) + ' → ' + flights['destination'].astype(str), 'N/A'),
+        'Delay': np.round(delay, 1),
+        'Status': np.where(found, status, 'Unknown'),
     })
 
 
@@ -291,71 +722,118 @@ def get_flight_volume_timeline(G: nx.MultiDiGraph, start_time: datetime, end_tim
 # Visualization Functions
 # ============================================================================
 
+# Airport marker colors on the network map: average delay below 15 min is
+# green, below 30 min orange, otherwise red
+AIRPORT_DELAY_THRESHOLDS = np.array([15, 30])
+AIRPORT_DELAY_COLORS = np.array(['green', 'orange', 'red'])
+
+# Only the busiest airports get a code label on the network map
+AIRPORT_LABEL_LIMIT = 30
+
+# Continental US base map for the network map
+BASE_GEO_LAYOUT = dict(
+    scope='usa',
+    projection=dict(type='albers usa'),
+    showland=True,
+    landcolor='rgb(243, 243, 243)',
+    showocean=True,
+    oceancolor='rgb(230, 245, 255)',
+    showlakes=True,
+    lakecolor='rgb(230, 245, 255)',
+    showrivers=True,
+    rivercolor='rgb(230, 245, 255)',
+    lonaxis=dict(range=[-130, -65]),
+    lataxis=dict(range=[24, 50]),
+    resolution=110
+)
+
+# Network map layout that does not depend on the current time
+NETWORK_MAP_LAYOUT = dict(
+    geo=BASE_GEO_LAYOUT,
+    height=600,
+    margin=dict(l=0, r=0, t=40, b=0),
+    annotations=[
+        dict(
+            text="Node size = Activity | Color = Delay status (Green: On-time, Orange: Moderate, Red: Delayed) | Blue lines = Active flights",
+            showarrow=False,
+            xref="paper", yref="paper",
+            x=0.005, y=-0.002,
+            xanchor="left", yanchor="bottom",
+            font=dict(size=10, color="#888")
+        )
+    ],
+)
+
+
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS, max_entries=512)
 def create_network_graph(G: nx.MultiDiGraph, current_time: datetime) -> go.Figure:
-    """Create interactive geographic map visualization with airports and flight routes at current time."""
-    # Get airport coordinates
-    airport_coords = get_airport_coordinates(G)
+    """Create interactive geographic map visualization with airports and flight routes at current time.
     
-    if not airport_coords:
+    Cached by Streamlit per loaded graph and time, so moving the slider back
+    to a time already shown reuses the figure.
+    """
+    # All airports in code order (route endpoints index into these arrays),
+    # and the ones with coordinates that are drawn on the map
+    airport_table = get_airport_table(G)
+    airport_lats = airport_table['lat'].to_numpy(dtype=np.float64)
+    airport_lons = airport_table['lon'].to_numpy(dtype=np.float64)
+    airport_has_coords = airport_table['has_coords'].to_numpy(dtype=bool)
+    airports = airport_table[airport_has_coords].reset_index(drop=True)
+    
+    if airports.empty:
         # Fallback to basic graph if no coordinates available
         st.warning("⚠️ No airport coordinates found. Please add latitude/longitude to airports_sample.csv")
         return create_fallback_graph(G, current_time)
     
-    # Get active flights at current time
-    active_flights = get_active_flights_at_time(G, current_time)
-    
-    # Prepare airport data for map
-    airport_lats = []
-    airport_lons = []
-    airport_codes = []
-    airport_text = []
-    airport_sizes = []
-    airport_colors = []
-    
-    for airport_code in sorted(G.nodes()):
-        if airport_code in airport_coords:
-            lat, lon = airport_coords[airport_code]
-            airport_lats.append(lat)
-            airport_lons.append(lon)
-            airport_codes.append(airport_code)
-            
-            # Get airport state at current time
-            state = get_airport_state_at_time(G, airport_code, current_time)
-            node_data = G.nodes[airport_code]
-            airport_name = node_data.get('airport_name', airport_code)
-            
-            if state:
-                activity = state['total_departures'] + state['total_arrivals']
-                avg_delay = (state.get('avg_departure_delay', 0) + state.get('avg_arrival_delay', 0)) / 2
-                
-                # Size based on activity
-                size = max(10, min(50, activity * 3))
-                airport_sizes.append(size)
-                
-                # Tooltip text
-                text = f"{airport_code} - {airport_name}<br>Departures: {state['total_departures']}<br>Arrivals: {state['total_arrivals']}<br>Avg Delay: {avg_delay:.1f} min<br>Active Flights: {sum(1 for f in active_flights if f['origin'] == airport_code)}"
-                airport_text.append(text)
-                
-                # Color by delay status
-                if avg_delay < 15:
-                    airport_colors.append('green')
-                elif avg_delay < 30:
-                    airport_colors.append('orange')
-                else:
-                    airport_colors.append('red')
-            else:
-                airport_sizes.append(10)
-                airport_text.append(f"{airport_code} - {airport_name}<br>No activity yet")
-                airport_colors.append('gray')
+    # Active flights at current time, counted per origin airport
+    active_by_origin = get_active_origin_counts(G, current_time)
+    
+    # Add each airport's state at current time to its row
+    airport_states = get_airport_states_at_time(G, airports['code'], current_time)
+    airports['has_state'] = [state is not None for state in airport_states]
+    airports['total_departures'] = [state['total_departures'] if state else 0 for state in airport_states]
+    airports['total_arrivals'] = [state['total_arrivals'] if state else 0 for state in airport_states]
+    airports['avg_departure_delay'] = [state.get('avg_departure_delay', 0) if state else 0 for state in airport_states]
+    airports['avg_arrival_delay'] = [state.get('avg_arrival_delay', 0) if state else 0 for state in airport_states]
+    airports['active_flights'] = [active_by_origin[airport_code] for airport_code in airports['code']]
+    
+    # Size, color and tooltip for every airport at once; airports without
+    # snapshots get the small gray "no activity" marker
+    has_state = airports['has_state'].to_numpy(dtype=bool)
+    activity = (airports['total_departures'] + airports['total_arrivals']).to_numpy()
+    avg_delay = ((airports['avg_departure_delay'] + airports['avg_arrival_delay']) / 2).to_numpy(dtype=float)
+    
+    # Size based on activity
+    airport_sizes = np.where(has_state, np.clip(activity * 3, 10, 50), 10)
+    
+    # Color by delay status: bucket each average delay against the thresholds
+    delay_colors = AIRPORT_DELAY_COLORS[np.digitize(avg_delay, AIRPORT_DELAY_THRESHOLDS)]
+    airport_colors = np.where(has_state, delay_colors, 'gray')
+    
+    # Tooltip text
+    airport_label = airports['code'] + ' - ' + airports['airport_name'].astype(str)
+    activity_text = (
+        airport_label
+        + '<br>Departures: ' + airports['total_departures'].astype(str)
+        + '<br>Arrivals: ' + airports['total_arrivals'].astype(str)
+        + '<br>Avg Delay: ' + pd.Series(avg_delay).map('{:.1f}'.format) + ' min'
+        + '<br>Active Flights: ' + airports['active_flights'].astype(str)
+    )
+    airport_text = np.where(has_state, activity_text, airport_label + '<br>No activity yet')
+    
+    # Label only the busiest airports; every text label is an SVG node that
+    # has to be redrawn on each update
+    label_all = len(airports) <= AIRPORT_LABEL_LIMIT
+    label_font = dict(size=12, color="white", family="Arial Black")
     
     # Create airport scattergeo trace
     airport_trace = go.Scattergeo(
-        lat=airport_lats,
-        lon=airport_lons,
-        mode='markers+text',
-        text=airport_codes,
+        lat=airports['lat'],
+        lon=airports['lon'],
+        mode='markers+text' if label_all else 'markers',
+        text=airports['code'] if label_all else None,
         textposition="middle center",
-        textfont=dict(size=12, color="white", family="Arial Black"),
+        textfont=label_font,
         hovertext=airport_text,
         hoverinfo='text',
         marker=dict(
@@ -366,124 +844,115 @@ def create_network_graph(G: nx.MultiDiGraph, current_time: datetime) -> go.Figur
         ),
         name='Airports'
     )
+    airport_traces = [airport_trace]
+    
+    if not label_all:
+        busiest = np.argpartition(-activity, AIRPORT_LABEL_LIMIT)[:AIRPORT_LABEL_LIMIT]
+        labeled = airports.iloc[np.sort(busiest)]
+        airport_traces.append(go.Scattergeo(
+            lat=labeled['lat'],
+            lon=labeled['lon'],
+            mode='text',
+            text=labeled['code'],
+            textposition="middle center",
+            textfont=label_font,
+            hoverinfo='skip',
+            showlegend=False
+        ))
     
-    # Prepare flight route data
-    route_data = {}
-    for origin, destination, key, data in G.edges(data=True, keys=True):
-        route = (origin, destination)
-        if route not in route_data:
-            route_data[route] = []
-        
-        dep_time = parse_iso8601_datetime(data.get('actual_departure_gate') or data.get('scheduled_departure_gate'))
-        arr_time = parse_iso8601_datetime(data.get('actual_arrival_gate') or data.get('scheduled_arrival_gate'))
-        
-        if dep_time and arr_time:
-            route_data[route].append({
-                'dep': dep_time,
-                'arr': arr_time,
-                'delay': data.get('departure_delay_minutes', 0) or 0
-            })
-    
-    # Create route traces (lines between airports)
+    # Flight status at current time from the edge departure/arrival seconds,
+    # for all mappable flights at once
+    edge_arrays = get_edge_arrays(G)
+    dep_ts = edge_arrays['dep_ts']
+    arr_ts = edge_arrays['arr_ts']
+    current_ts = current_time.timestamp()
+    active_mask = (dep_ts <= current_ts) & (current_ts < arr_ts)
+    completed_mask = arr_ts <= current_ts
+    
+    # Count active and completed flights per route in one C pass each,
+    # keeping only routes with at least one of either
+    route_origin_idx = edge_arrays['route_origin_idx']
+    route_dest_idx = edge_arrays['route_dest_idx']
+    active_counts = np.bincount(edge_arrays['route_idx'][active_mask], minlength=len(route_origin_idx))
+    completed_counts = np.bincount(edge_arrays['route_idx'][completed_mask], minlength=len(route_origin_idx))
+    drawn = (active_counts > 0) | (completed_counts > 0)
+    origin_idx = route_origin_idx[drawn]
+    dest_idx = route_dest_idx[drawn]
+    active_counts = active_counts[drawn]
+    
+    # Route endpoint coordinates, looked up by airport index for all routes at once
+    origin_lats, origin_lons = airport_lats[origin_idx], airport_lons[origin_idx]
+    dest_lats, dest_lons = airport_lats[dest_idx], airport_lons[dest_idx]
+    
+    # Line style per route: active routes are blue with width by active
+    # flight count (2-8), completed-only routes thin gray. Styles are coded
+    # as the width for active routes and 0 for completed ones
+    style_codes = np.where(active_counts > 0, np.clip(active_counts, 2, 8), 0)
+    
+    # Create route traces (lines between airports), one per line style in
+    # order of first appearance. Each trace draws all its routes as
+    # segments separated by NaN, so Plotly handles a handful of traces
+    # however many routes are shown
     route_traces = []
-    for (origin, dest), flights in route_data.items():
-        if origin not in airport_coords or dest not in airport_coords:
-            continue
-        
-        # Count active flights on this route
-        active_count = sum(1 for f in flights if f['dep'] <= current_time < f['arr'])
-        completed_count = sum(1 for f in flights if f['arr'] <= current_time)
+    for style_code in pd.unique(style_codes).tolist():
+        if style_code > 0:
+            line_color, width, opacity = 'blue', style_code, 0.7  # Active flights
+        else:
+            line_color, width, opacity = 'gray', 2, 0.3  # Completed flights
         
-        if active_count > 0 or completed_count > 0:
-            origin_lat, origin_lon = airport_coords[origin]
-            dest_lat, dest_lon = airport_coords[dest]
-            
-            # Determine color based on status
-            if active_count > 0:
-                line_color = 'blue'  # Active flights
-                opacity = 0.7
-                width = max(2, min(8, active_count))
-            elif completed_count > 0:
-                line_color = 'gray'  # Completed flights
-                opacity = 0.3
-                width = 2
-            else:
-                continue
-            
-            # Create great circle route (geodesic line)
-            route_trace = go.Scattergeo(
-                lat=[origin_lat, dest_lat],
-                lon=[origin_lon, dest_lon],
-                mode='lines',
-                line=dict(width=width, color=line_color),
-                opacity=opacity,
-                hoverinfo='skip',
-                showlegend=False
-            )
-            route_traces.append(route_trace)
-    
-    # Create figure with geographic projection
-    fig = go.Figure()
-    
-    # Add route traces first (so airports appear on top)
-    for trace in route_traces:
-        fig.add_trace(trace)
-    
-    # Add airport trace
-    fig.add_trace(airport_trace)
-    
-    # Update layout for US map
-    fig.update_geos(
-        scope='usa',
-        projection_type='albers usa',
-        showland=True,
-        landcolor='rgb(243, 243, 243)',
-        showocean=True,
-        oceancolor='rgb(230, 245, 255)',
-        showlakes=True,
-        lakecolor='rgb(230, 245, 255)',
-        showrivers=True,
-        rivercolor='rgb(230, 245, 255)',
-        lonaxis_range=[-130, -65],
-        lataxis_range=[24, 50],
-        resolution=110
-    )
+        in_style = style_codes == style_code
+        gaps = np.full(in_style.sum(), np.nan)
+        route_traces.append(go.Scattergeo(
+            lat=np.column_stack([origin_lats[in_style], dest_lats[in_style], gaps]).ravel(),
+            lon=np.column_stack([origin_lons[in_style], dest_lons[in_style], gaps]).ravel(),
+            mode='lines',
+            line=dict(width=width, color=line_color),
+            opacity=opacity,
+            hoverinfo='skip',
+            showlegend=False
+        ))
     
-    fig.update_layout(
-        title=dict(
-            text=f"Network Map at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC",
-            x=0.5,
-            xanchor='center',
-            font=dict(size=16)
+    # Create figure with geographic projection in one call: route traces
+    # first (so airports appear on top), the static map layout (base map
+    # included) plus the current time in the title
+    fig = go.Figure(
+        data=route_traces + airport_traces,
+        layout=dict(
+            NETWORK_MAP_LAYOUT,
+            title=dict(
+                text=f"Network Map at {current_time.strftime('%Y-%m-%d %H:%M:%S')} UTC",
+                x=0.5,
+                xanchor='center',
+                font=dict(size=16)
+            ),
         ),
-        height=600,
-        margin=dict(l=0, r=0, t=40, b=0),
-        annotations=[
-            dict(
-                text="Node size = Activity | Color = Delay status (Green: On-time, Orange: Moderate, Red: Delayed) | Blue lines = Active flights",
-                showarrow=False,
-                xref="paper", yref="paper",
-                x=0.005, y=-0.002,
-                xanchor="left", yanchor="bottom",
-                font=dict(size=10, color="#888")
-            )
-        ]
     )
     
     return fig
 
 
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS)
+def get_fallback_layout(G: nx.MultiDiGraph) -> Tuple[List[str], np.ndarray]:
+    """
+    Spring layout for create_fallback_graph, computed once per loaded graph.
+    
+    Returns the nodes in G.nodes() order and an (n, 2) array of positions.
+    """
+    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    nodes = list(G.nodes())
+    return nodes, np.array([pos[n] for n in nodes], dtype=np.float64).reshape(-1, 2)
+
+
 def create_fallback_graph(G: nx.MultiDiGraph, current_time: datetime) -> go.Figure:
     """Fallback network graph when coordinates are not available."""
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-    node_x = [pos[n][0] for n in G.nodes()]
-    node_y = [pos[n][1] for n in G.nodes()]
+    nodes, positions = get_fallback_layout(G)
+    node_x, node_y = positions.T
     
     fig = go.Figure(
-        data=[go.Scatter(
+        data=[go.Scattergl(
             x=node_x, y=node_y,
             mode='markers+text',
-            text=list(G.nodes()),
+            text=nodes,
             textposition="middle center",
             marker=dict(size=20, color='blue')
         )],
@@ -496,127 +965,145 @@ def create_fallback_graph(G: nx.MultiDiGraph, current_time: datetime) -> go.Figu
     return fig
 
 
-def create_airport_status_panel(G: nx.MultiDiGraph, airport_code: str, current_time: datetime) -> Dict:
-    """Get airport status metrics for display in panel."""
-    state = get_airport_state_at_time(G, airport_code, current_time)
-    node_data = G.nodes[airport_code]
-    
-    if not state:
-        return {
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS, max_entries=512)
+def create_airport_status_table(G: nx.MultiDiGraph, current_time: datetime) -> pd.DataFrame:
+    """Get airport status metrics for every airport at current time, one row per airport.
+    
+    Rows are in airport code order, with columns airport_code, airport_name,
+    total_departures, total_arrivals, active_flights, avg_departure_delay,
+    avg_arrival_delay, on_time_departure_pct and on_time_arrival_pct.
+    Airports without snapshots get zeros. Built in one call per time (and
+    cached like create_network_graph) instead of one call per airport.
+    """
+    # Active flights per origin airport, counted once for all airports
+    active_by_origin = get_active_origin_counts(G, current_time)
+    
+    airport_codes = sorted(G.nodes())
+    rows = []
+    for airport_code, state in zip(airport_codes, get_airport_states_at_time(G, airport_codes, current_time)):
+        state = state or {}
+        rows.append({
             'airport_code': airport_code,
-            'airport_name': node_data.get('airport_name', 'Unknown'),
-            'total_departures': 0,
-            'total_arrivals': 0,
-            'active_flights': 0,
-            'avg_departure_delay': 0.0,
-            'avg_arrival_delay': 0.0,
-            'on_time_departure_pct': 0.0,
-            'on_time_arrival_pct': 0.0,
-        }
+            'airport_name': G.nodes[airport_code].get('airport_name', 'Unknown'),
+            'total_departures': state.get('total_departures', 0),
+            'total_arrivals': state.get('total_arrivals', 0),
+            'active_flights': active_by_origin[airport_code] if state else 0,
+            'avg_departure_delay': state.get('avg_departure_delay', 0.0),
+            'avg_arrival_delay': state.get('avg_arrival_delay', 0.0),
+            'on_time_departure_pct': state.get('on_time_departure_pct', 0.0),
+            'on_time_arrival_pct': state.get('on_time_arrival_pct', 0.0),
+        })
     
-    # Count active flights (flights departing from this airport that are in the air)
-    active_flights = get_active_flights_at_time(G, current_time)
-    airport_active = sum(1 for f in active_flights if f['origin'] == airport_code)
+    return pd.DataFrame(rows, columns=[
+        'airport_code', 'airport_name', 'total_departures', 'total_arrivals', 'active_flights',
+        'avg_departure_delay', 'avg_arrival_delay', 'on_time_departure_pct', 'on_time_arrival_pct',
+    ])
+
+
+# Most points per series create_flight_volume_chart hands to Plotly
+MAX_TIMELINE_POINTS = 2000
+
+# Longest timeline create_flight_volume_chart still draws with point markers
+MAX_MARKER_POINTS = 500
+
+
+def downsample_timeline(df: pd.DataFrame, max_points: int = MAX_TIMELINE_POINTS) -> pd.DataFrame:
+    """
+    Reduce a per-interval timeline to at most max_points rows for plotting.
     
-    return {
-        'airport_code': airport_code,
-        'airport_name': node_data.get('airport_name', 'Unknown'),
-        'total_departures': state.get('total_departures', 0),
-        'total_arrivals': state.get('total_arrivals', 0),
-        'active_flights': airport_active,
-        'avg_departure_delay': state.get('avg_departure_delay', 0.0),
-        'avg_arrival_delay': state.get('avg_arrival_delay', 0.0),
-        'on_time_departure_pct': state.get('on_time_departure_pct', 0.0),
-        'on_time_arrival_pct': state.get('on_time_arrival_pct', 0.0),
-    }
+    Consecutive rows are bucketed; each bucket keeps its last time and
+    cumulative values and its peak flights_enroute, so running totals and
+    peaks survive. Frames that are short enough are returned unchanged.
+    """
+    if len(df) <= max_points:
+        return df
+    
+    step = -(-len(df) // max_points)  # ceiling division
+    buckets = np.arange(len(df)) // step
+    aggregations = {column: 'max' if column == 'flights_enroute' else 'last' for column in df.columns}
+    return df.groupby(buckets).agg(aggregations).reset_index(drop=True)
 
 
-def create_flight_volume_chart(df: pd.DataFrame, current_time: datetime) -> go.Figure:
+@st.cache_data(hash_funcs=GRAPH_HASH_FUNCS, max_entries=512)
+def create_flight_volume_chart(
+    G: nx.MultiDiGraph,
+    first_departure: datetime,
+    last_arrival: datetime,
+    minutes_from_start: int
+) -> go.Figure:
     """Create flight volume timeline chart with flights enroute and cumulative delays.
     
     Chart shows:
     - Flights enroute (count, left Y-axis)
     - Cumulative outbound delay (total minutes, right Y-axis)
     - Cumulative inbound delay (total minutes, right Y-axis)
+    
+    The current time is minutes_from_start after first_departure. Cached by
+    Streamlit per loaded graph, time range and slider position, so the
+    timeline DataFrame is looked up inside instead of hashed on every call.
     """
     fig = go.Figure()
+    df = get_volume_chart_data(G, first_departure, last_arrival, interval_minutes=1)
+    current_time = first_departure + timedelta(minutes=minutes_from_start)
     
     # Validate DataFrame
     if df.empty or 'time' not in df.columns:
         st.warning("No data available for flight volume timeline chart")
         return fig
     
-    # Ensure time column is datetime type
-    try:
-        if not pd.api.types.is_datetime64_any_dtype(df['time']):
-            df['time'] = pd.to_datetime(df['time'])
-    except Exception as e:
-        st.error(f"Error converting time column: {e}")
-        return fig
+    # Times, numeric values and axis maxima were prepared by get_volume_chart_data
+    y_max_left = df.attrs.get('y_max_left', 1.0)
+    y_max_right = df.attrs.get('y_max_right', 1.0)
     
-    # Fill NaN values with 0 for safety
-    df = df.fillna(0)
+    # Long replays have more points than the chart has pixels; plot a
+    # downsampled copy with WebGL traces
+    timeline = downsample_timeline(df)
     
-    # Calculate max values safely
-    y_max_left = 1.0
-    y_max_right = 1.0
+    # Markers are only readable (and cheap) on short timelines; dense ones
+    # are drawn as plain lines
+    trace_mode = 'lines' if len(timeline) > MAX_MARKER_POINTS else 'lines+markers'
     
     # Add flights enroute line (left Y-axis)
-    if 'flights_enroute' in df.columns and len(df) > 0:
-        enroute_values = pd.to_numeric(df['flights_enroute'], errors='coerce').fillna(0)
+    if 'flights_enroute' in timeline:
+        enroute_values = timeline['flights_enroute']
         # Always add trace, even if values are zero (shows tracking)
-        fig.add_trace(go.Scatter(
-            x=df['time'],
+        fig.add_trace(go.Scattergl(
+            x=timeline['time'],
             y=enroute_values,
-            mode='lines+markers',
+            mode=trace_mode,
             name='Flights Enroute',
             line=dict(color='blue', width=2),
             marker=dict(size=4),
             yaxis='y'
         ))
-        # Calculate max safely
-        try:
-            y_max_left = max(float(enroute_values.max()), 1.0)
-        except (ValueError, TypeError):
-            y_max_left = 1.0
     
     # Add cumulative outbound delay line (right Y-axis)
-    if 'cumulative_outbound_delay' in df.columns and len(df) > 0:
-        outbound_values = pd.to_numeric(df['cumulative_outbound_delay'], errors='coerce').fillna(0)
+    if 'cumulative_outbound_delay' in timeline:
+        outbound_values = timeline['cumulative_outbound_delay']
         # Always add trace (cumulative delays should be tracked even if zero initially)
-        fig.add_trace(go.Scatter(
-            x=df['time'],
+        fig.add_trace(go.Scattergl(
+            x=timeline['time'],
             y=outbound_values,
-            mode='lines+markers',
+            mode=trace_mode,
             name='Cumulative Outbound Delay',
             line=dict(color='red', width=2),
             marker=dict(size=4),
             yaxis='y2'
         ))
-        # Calculate max safely
-        try:
-            y_max_right = max(y_max_right, float(outbound_values.max()), 1.0)
-        except (ValueError, TypeError):
-            y_max_right = max(y_max_right, 1.0)
     
     # Add cumulative inbound delay line (right Y-axis)
-    if 'cumulative_inbound_delay' in df.columns and len(df) > 0:
-        inbound_values = pd.to_numeric(df['cumulative_inbound_delay'], errors='coerce').fillna(0)
+    if 'cumulative_inbound_delay' in timeline:
+        inbound_values = timeline['cumulative_inbound_delay']
         # Always add trace (cumulative delays should be tracked even if zero initially)
-        fig.add_trace(go.Scatter(
-            x=df['time'],
+        fig.add_trace(go.Scattergl(
+            x=timeline['time'],
             y=inbound_values,
-            mode='lines+markers',
+            mode=trace_mode,
             name='Cumulative Inbound Delay',
             line=dict(color='orange', width=2),
             marker=dict(size=4),
             yaxis='y2'
         ))
-        # Calculate max safely
-        try:
-            y_max_right = max(y_max_right, float(inbound_values.max()), 1.0)
-        except (ValueError, TypeError):
-            y_max_right = max(y_max_right, 1.0)
     
     # Ensure we have at least one trace
     if len(fig.data) == 0:
@@ -711,64 +1198,48 @@ def create_flight_volume_chart(df: pd.DataFrame, current_time: datetime) -> go.F
 # Main Dashboard
 # ============================================================================
 
-def main():
-    """Main dashboard function."""
-    # Title and header
-    st.title("✈️ Airline Network Performance Dashboard")
-    st.markdown("Real-time visualization of airline operations throughout the simulation period")
-    
-    # Sidebar: Data loading options
-    st.sidebar.header("📂 Data Source")
-    
-    graph_file_option = st.sidebar.selectbox(
-        "Load graph from:",
-        options=["Build from CSV", "Load from JSON file"],
-        index=0
-    )
-    
-    # Load or build graph
-    try:
-        with st.spinner("Loading graph data..."):
-            if graph_file_option == "Load from JSON file":
-                graph_file_path = st.sidebar.text_input(
-                    "Graph file path:",
-                    value="data/processed/t1.json"
-                )
-                if graph_file_path:
-                    graph_file = project_root / graph_file_path
-                    if graph_file.exists():
-                        G = load_or_build_graph(graph_file=graph_file)
-                    else:
-                        st.error(f"❌ Graph file not found: {graph_file}")
-                        st.stop()
-                else:
-                    st.error("❌ Please provide a graph file path.")
-                    st.stop()
-            else:
-                data_dir = st.sidebar.text_input(
-                    "Data directory (optional):",
-                    value="data/raw"
-                )
-                data_dir_path = project_root / data_dir if data_dir else None
-                G = load_or_build_graph(data_dir=data_dir_path)
-        
-        if G.number_of_nodes() == 0:
-            st.error("❌ Graph is empty. Please check your data files.")
-            st.stop()
-        
-        st.sidebar.success(f"✅ Graph loaded: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
-    
-    except Exception as e:
-        st.error(f"❌ Error loading graph: {e}")
-        st.stop()
-    
-    # Get time range
-    first_departure, last_arrival = get_time_range(G)
-    
-    if not first_departure or not last_arrival:
-        st.error("❌ Could not determine time range from graph data.")
-        st.stop()
+# Events table column definitions, in events DataFrame column order. They
+# never change, so they are built once here rather than on every rerun.
+# Text columns get an explicit text filter; Delay is numeric
+EVENT_TEXT_FILTER_PARAMS = {
+    'filterOptions': ['equals', 'notEqual', 'contains', 'notContains', 'startsWith', 'endsWith']
+}
+EVENT_COLUMN_DEFS = [
+    {'field': 'Timestamp', 'headerName': 'Timestamp', 'type': [], 'width': 200, 'pinned': 'left',
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+    {'field': 'Time', 'headerName': 'Time', 'type': [], 'width': 100,
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+    {'field': 'Event Type', 'headerName': 'Event Type', 'type': [], 'width': 100,
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+    {'field': 'Airport', 'headerName': 'Airport', 'type': [], 'width': 80,
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+    {'field': 'Flight ID', 'headerName': 'Flight ID', 'type': [], 'width': 200,
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+    {'field': 'Route', 'headerName': 'Route', 'type': [], 'width': 120,
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+    {'field': 'Delay', 'headerName': 'Delay', 'type': ["numericColumn", "numberColumnFilter", "customNumericFormat"],
+     'precision': 1, 'width': 100, 'filterable': True, 'sortable': True},
+    {'field': 'Status', 'headerName': 'Status', 'type': [], 'width': 150,
+     'filterable': True, 'sortable': True,
+     'filter': 'agTextColumnFilter', 'filterParams': EVENT_TEXT_FILTER_PARAMS},
+]
+
+
+@st.fragment
+def time_panel(G: nx.MultiDiGraph, first_departure: datetime, last_arrival: datetime):
+    """
+    Time slider and every view that depends on the replay time.
     
+    Runs as a Streamlit fragment, so moving the slider reruns only this
+    panel (network graph, airport status, volume chart) and not graph
+    loading or the event timeline.
+    """
     # Time Control Panel
     st.header("⏰ Time Control")
     
@@ -799,7 +1270,9 @@ def main():
     
     with st.spinner("Generating network graph..."):
         network_fig = create_network_graph(G, current_time)
-        st.plotly_chart(network_fig, use_container_width=True)
+        # A stable key keeps the same chart element across slider moves, so
+        # the browser updates the plot in place instead of rebuilding it
+        st.plotly_chart(network_fig, use_container_width=True, key="network_graph")
     
     # Airport Status Table
     st.header("📍 Airport Status")
@@ -807,23 +1280,22 @@ def main():
     # Add note about time control below the table title
     st.caption(f"Note: This table updates with Time Control to reflect the status of airports. Current replay time is {current_time.strftime('%H:%M')}Z.")
     
-    airports = sorted(G.nodes())
-    
-    # Prepare data for table (removed "Airport Name" and "Active Flights" columns)
-    airport_data = []
-    for airport_code in airports:
-        status = create_airport_status_panel(G, airport_code, current_time)
-        airport_data.append({
-            'Airport': status['airport_code'],
-            'Departures': status['total_departures'],
-            'Arrivals': status['total_arrivals'],
-            'Avg Dep Delay': round(status['avg_departure_delay'], 1) if status['total_departures'] > 0 else None,
-            'Avg Arr Delay': round(status['avg_arrival_delay'], 1) if status['total_arrivals'] > 0 else None,
-            'On-Time Dep %': round(status['on_time_departure_pct'], 1) if status['total_departures'] > 0 else None,
-            'On-Time Arr %': round(status['on_time_arrival_pct'], 1) if status['total_arrivals'] > 0 else None,
-        })
-    
-    airport_df = pd.DataFrame(airport_data)
+    # Status of all airports at current time, in one call
+    status_table = create_airport_status_table(G, current_time)
+    
+    # Prepare data for table (removed "Airport Name" and "Active Flights" columns);
+    # averages and percentages are blank for airports with no flights yet
+    has_departures = status_table['total_departures'] > 0
+    has_arrivals = status_table['total_arrivals'] > 0
+    airport_df = pd.DataFrame({
+        'Airport': status_table['airport_code'],
+        'Departures': status_table['total_departures'],
+        'Arrivals': status_table['total_arrivals'],
+        'Avg Dep Delay': status_table['avg_departure_delay'].round(1).where(has_departures),
+        'Avg Arr Delay': status_table['avg_arrival_delay'].round(1).where(has_arrivals),
+        'On-Time Dep %': status_table['on_time_departure_pct'].round(1).where(has_departures),
+        'On-Time Arr %': status_table['on_time_arrival_pct'].round(1).where(has_arrivals),
+    })
     
     # Configure AgGrid (removed "Airport Name" and "Active Flights" columns)
     gb = GridOptionsBuilder.from_dataframe(airport_df)
@@ -851,44 +1323,74 @@ def main():
     # Flight Volume Timeline
     st.header("📊 Flight Volume Timeline")
     
-    with st.spinner("Calculating flight volume timeline..."):
-        # Get data for flights enroute and cumulative delays
-        # Sample at 1-minute intervals for performance (can increase for larger datasets)
-        enroute_df = get_flights_enroute_over_time(G, first_departure, last_arrival, interval_minutes=1)
-        outbound_delay_df = get_cumulative_delay_over_time(G, first_departure, last_arrival, interval_minutes=1, delay_type='departure')
-        inbound_delay_df = get_cumulative_delay_over_time(G, first_departure, last_arrival, interval_minutes=1, delay_type='arrival')
-        
-        # Merge dataframes on time (columns are already correctly named)
-        # Start with enroute data as base
-        volume_df = enroute_df.copy()
-        
-        # Merge delay dataframes if they exist and have data
-        if not outbound_delay_df.empty:
-            volume_df = volume_df.merge(outbound_delay_df, on='time', how='outer')
-        else:
-            volume_df['cumulative_outbound_delay'] = 0
-        
-        if not inbound_delay_df.empty:
-            volume_df = volume_df.merge(inbound_delay_df, on='time', how='outer')
-        else:
-            volume_df['cumulative_inbound_delay'] = 0
-        
-        # Sort by time and fill missing values
-        volume_df = volume_df.sort_values('time').reset_index(drop=True)
-        
-        # Forward-fill missing values for cumulative delays (they should be monotonically increasing)
-        if 'cumulative_outbound_delay' in volume_df.columns:
-            volume_df['cumulative_outbound_delay'] = pd.to_numeric(volume_df['cumulative_outbound_delay'], errors='coerce').ffill().fillna(0)
-        if 'cumulative_inbound_delay' in volume_df.columns:
-            volume_df['cumulative_inbound_delay'] = pd.to_numeric(volume_df['cumulative_inbound_delay'], errors='coerce').ffill().fillna(0)
-        if 'flights_enroute' in volume_df.columns:
-            volume_df['flights_enroute'] = pd.to_numeric(volume_df['flights_enroute'], errors='coerce').fillna(0)
+    volume_fig = create_flight_volume_chart(G, first_departure, last_arrival, minutes_from_start)
+    st.plotly_chart(volume_fig, use_container_width=True, key="flight_volume_chart")
+
+
+def main():
+    """Main dashboard function."""
+    # Title and header
+    st.title("✈️ Airline Network Performance Dashboard")
+    st.markdown("Real-time visualization of airline operations throughout the simulation period")
+    
+    # Sidebar: Data loading options
+    st.sidebar.header("📂 Data Source")
+    
+    graph_file_option = st.sidebar.selectbox(
+        "Load graph from:",
+        options=["Build from CSV", "Load from JSON file"],
+        index=0
+    )
+    
+    # Load or build graph
+    try:
+        with st.spinner("Loading graph data..."):
+            if graph_file_option == "Load from JSON file":
+                graph_file_path = st.sidebar.text_input(
+                    "Graph file path:",
+                    value="data/processed/t1.json"
+                )
+                if graph_file_path:
+                    graph_file = project_root / graph_file_path
+                    if graph_file.exists():
+                        G = load_or_build_graph(graph_file=graph_file)
+                    else:
+                        st.error(f"❌ Graph file not found: {graph_file}")
+                        st.stop()
+                else:
+                    st.error("❌ Please provide a graph file path.")
+                    st.stop()
+            else:
+                data_dir = st.sidebar.text_input(
+                    "Data directory (optional):",
+                    value="data/raw"
+                )
+                data_dir_path = project_root / data_dir if data_dir else None
+                G = load_or_build_graph(data_dir=data_dir_path)
         
-        # Ensure time column is datetime
-        volume_df['time'] = pd.to_datetime(volume_df['time'])
+        if G.number_of_nodes() == 0:
+            st.error("❌ Graph is empty. Please check your data files.")
+            st.stop()
         
-        volume_fig = create_flight_volume_chart(volume_df, current_time)
-        st.plotly_chart(volume_fig, use_container_width=True)
+        st.sidebar.success(f"✅ Graph loaded: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    
+    except Exception as e:
+        st.error(f"❌ Error loading graph: {e}")
+        st.stop()
+    
+    # Get time range
+    first_departure, last_arrival = get_time_range(G)
+    
+    if not first_departure or not last_arrival:
+        st.error("❌ Could not determine time range from graph data.")
+        st.stop()
+    
+    # Flight volume data does not depend on the replay time, so it is
+    # prepared (and cached) once here rather than on every slider move
+    with st.spinner("Calculating flight volume timeline..."):
+        get_volume_chart_data(G, first_departure, last_arrival, interval_minutes=1)
+    
+    time_panel(G, first_departure, last_arrival)
     
     # Event Timeline
     st.header("📅 Event Timeline")
@@ -899,97 +1401,11 @@ def main():
     window_start = first_departure
     window_end = last_arrival
     
-    events = get_events_in_window(G, window_start, window_end)
+    events = get_events_between(G, window_start, window_end)
     
     if events:
         # Build events DataFrame with route and delay information
-        events_data = []
-        for event in events:
-            flight_id = event.get('flight_id', 'unknown')
-            event_type = event.get('event_type', 'unknown').lower()
-            airport = event.get('airport', '')
-            timestamp = event.get('timestamp')
-            
-            # Find flight edge to get route and delay information
-            route = 'N/A'
-            delay = 0.0  # Initialize to 0.0 instead of None
-            status = 'Unknown'
-            is_departure = None
-            
-            # Search for flight in graph edges
-            flight_found = False
-            for origin, destination, key, data in G.edges(data=True, keys=True):
-                if data.get('flight_id') == flight_id:
-                    flight_found = True
-                    route = f"{origin} → {destination}"
-                    
-                    # Get appropriate delay based on event type
-                    if event_type == 'departure':
-                        delay_val = data.get('departure_delay_minutes', 0)
-                        is_departure = True
-                    elif event_type == 'arrival':
-                        delay_val = data.get('arrival_delay_minutes', 0)
-                        is_departure = False
-                    else:
-                        delay_val = 0
-                        is_departure = None
-                    
-                    # Convert delay to float for proper comparison
-                    # Handle None, string, or numeric values
-                    if delay_val is None:
-                        delay = 0.0
-                    else:
-                        try:
-                            delay = float(delay_val)
-                        except (ValueError, TypeError):
-                            delay = 0.0
-                    
-                    break
-            
-            # Determine status based on event type and delay (only if flight was found)
-            if flight_found:
-                # On-time threshold: exactly 0 or negative (early) is considered on-time/early
-                # Any positive delay is considered "late"
-                if delay < 0:
-                    # Early: specify whether departure or arrival
-                    if is_departure:
-                        status = 'Early Departure'
-                    elif is_departure is False:
-                        status = 'Early Arrival'
-                    else:
-                        status = 'Early'
-                elif delay == 0:
-                    # On-time: generic label (applies to both departures and arrivals)
-                    status = 'On-Time'
-                elif delay <= 30:
-                    # Moderate delay: specify whether departure or arrival
-                    if is_departure:
-                        status = 'Late Departing'
-                    elif is_departure is False:
-                        status = 'Late Arriving'
-                    else:
-                        status = 'Late'
-                else:
-                    # Significant delay: specify whether departure or arrival
-                    if is_departure:
-                        status = 'Significantly Late Departing'
-                    elif is_departure is False:
-                        status = 'Significantly Late Arriving'
-                    else:
-                        status = 'Significantly Late'
-            
-            events_data.append({
-                'Timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S UTC') if timestamp else '',
-                'Time': timestamp.strftime('%H:%M:%S') if timestamp else '',
-                'Event Type': event_type.upper(),
-                'Airport': airport,
-                'Flight ID': flight_id,
-                'Route': route,
-                'Delay': round(float(delay), 1) if delay is not None else None,
-                'Status': status
-            })
-        
-        events_df = pd.DataFrame(events_data)
+        events_df = build_events_table(events, get_flight_index(G))
         
         # Configure AgGrid for events table
         gb_events = GridOptionsBuilder.from_dataframe(events_df)
@@ -1005,55 +1421,12 @@ def main():
             resizable=True
         )
         
-        # Configure each column explicitly with filterable=True
-        # Explicitly configure filter for text columns to ensure they're filterable
-        # Use filterParams to configure filter options
-        text_columns = ["Timestamp", "Time", "Event Type", "Airport", "Flight ID", "Route", "Status"]
-        for col in text_columns:
-            if col == "Timestamp":
-                gb_events.configure_column(col, width=200, pinned='left', filterable=True, sortable=True)
-            elif col == "Time":
-                gb_events.configure_column(col, width=100, filterable=True, sortable=True)
-            elif col == "Event Type":
-                gb_events.configure_column(col, width=100, filterable=True, sortable=True)
-            elif col == "Airport":
-                gb_events.configure_column(col, width=80, filterable=True, sortable=True)
-            elif col == "Flight ID":
-                gb_events.configure_column(col, width=200, filterable=True, sortable=True)
-            elif col == "Route":
-                gb_events.configure_column(col, width=120, filterable=True, sortable=True)
-            elif col == "Status":
-                gb_events.configure_column(col, width=150, filterable=True, sortable=True)
-        
-        # Delay column - numeric with numberColumnFilter (already specified in type)
-        gb_events.configure_column(
-            "Delay", 
-            type=["numericColumn", "numberColumnFilter", "customNumericFormat"], 
-            precision=1, 
-            width=100,
-            filterable=True,
-            sortable=True
-        )
-        
         # Configure selection mode
         gb_events.configure_selection('single')
         grid_options_events = gb_events.build()
         
-        # After building, explicitly set filter for text columns in the grid options
-        # This ensures text columns have the agTextColumnFilter enabled
-        if 'columnDefs' in grid_options_events:
-            for col_def in grid_options_events['columnDefs']:
-                field_name = col_def.get('field', '')
-                # Ensure all columns are filterable
-                col_def['filterable'] = True
-                # For text columns (not Delay which is numeric), set explicit text filter
-                if field_name != 'Delay' and field_name in text_columns:
-                    col_def['filter'] = 'agTextColumnFilter'
-                    # Add filter params for text columns
-                    if 'filterParams' not in col_def:
-                        col_def['filterParams'] = {
-                            'filterOptions': ['equals', 'notEqual', 'contains', 'notContains', 'startsWith', 'endsWith']
-                        }
+        # Column definitions are fixed, so use the prebuilt ones
+        grid_options_events['columnDefs'] = EVENT_COLUMN_DEFS
         
         # Display AgGrid table
         AgGrid(
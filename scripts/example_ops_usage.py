@@ -10,17 +10,19 @@ This script demonstrates:
 """
 
 import sys
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, Tuple
 
 # Add parent directory to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from scripts.build_operations_graph import build_graph, load_graph, save_graph
-from scripts.load_sample_data import parse_iso8601_datetime
+from scripts.load_sample_data import parse_iso8601_datetime, parse_iso8601_datetime_cached
 import networkx as nx
+import pandas as pd
 
 
 def get_active_connections_at_time(G: nx.MultiDiGraph, target_time: datetime) -> List[tuple]:
@@ -39,17 +41,19 @@ def get_active_connections_at_time(G: nx.MultiDiGraph, target_time: datetime) ->
     
     active = []
     
+    # Each flight's times are shared by all its connections, so parses are
+    # memoized (parse_iso8601_datetime_cached) rather than repeated per edge
     for src_flight, tgt_flight, key, data in G.edges(keys=True, data=True):
         src_node = G.nodes[src_flight]
         tgt_node = G.nodes[tgt_flight]
         
         # Get source flight arrival time (prefer actual, fallback to scheduled)
         src_arr_str = src_node.get('act_arr_gmt') or src_node.get('sch_arr_gmt')
-        src_arr = parse_iso8601_datetime(src_arr_str) if src_arr_str else None
+        src_arr = parse_iso8601_datetime_cached(src_arr_str) if src_arr_str else None
         
         # Get target flight departure time (scheduled)
         tgt_dep_str = tgt_node.get('sch_dep_gmt')
-        tgt_dep = parse_iso8601_datetime(tgt_dep_str) if tgt_dep_str else None
+        tgt_dep = parse_iso8601_datetime_cached(tgt_dep_str) if tgt_dep_str else None
         
         if src_arr and tgt_dep:
             # Connection is active if source has arrived and target hasn't departed
@@ -59,12 +63,28 @@ def get_active_connections_at_time(G: nx.MultiDiGraph, target_time: datetime) ->
     return active
 
 
+def build_resource_index(G: nx.MultiDiGraph) -> Dict[Tuple[str, str], List[tuple]]:
+    """
+    Map (edge type, edge_label) to that resource's (src, tgt, key) edges.
+    
+    Edges keep their G.edges order. The index is a snapshot of G when it is
+    built: build it once for a graph that is no longer being changed and pass
+    it to get_flights_by_resource for each query, and build a new one after
+    adding or removing edges.
+    """
+    index = defaultdict(list)
+    for src_flight, tgt_flight, key, data in G.edges(keys=True, data=True):
+        index[(data.get('type'), data.get('edge_label'))].append((src_flight, tgt_flight, key))
+    return dict(index)
+
+
 def get_flights_by_resource(
     G: nx.MultiDiGraph,
     resource_type: str,
     resource_id: str,
     start_time: datetime = None,
-    end_time: datetime = None
+    end_time: datetime = None,
+    resource_index: Optional[Dict[Tuple[str, str], List[tuple]]] = None
 ) -> Set[str]:
     """
     Get all flights connected via a specific resource in a time window.
@@ -75,6 +95,10 @@ def get_flights_by_resource(
         resource_id: Resource identifier (e.g., tail number "8231", crew ID "P1001")
         start_time: Optional start time filter
         end_time: Optional end time filter
+        resource_index: Optional build_resource_index(G) result, for running
+            many queries against the same graph without scanning every edge
+            each time; it must be current for G. Without it, all edges are
+            scanned.
     
     Returns:
         Set of flight IDs using this resource
@@ -86,32 +110,40 @@ def get_flights_by_resource(
     
     flights = set()
     
-    for src_flight, tgt_flight, key, data in G.edges(keys=True, data=True):
-        if data.get('type') == resource_type and data.get('edge_label') == resource_id:
-            src_node = G.nodes[src_flight]
-            tgt_node = G.nodes[tgt_flight]
-            
-            # Get flight times
-            src_dep_str = src_node.get('sch_dep_gmt')
-            src_dep = parse_iso8601_datetime(src_dep_str) if src_dep_str else None
-            tgt_arr_str = tgt_node.get('act_arr_gmt') or tgt_node.get('sch_arr_gmt')
-            tgt_arr = parse_iso8601_datetime(tgt_arr_str) if tgt_arr_str else None
-            
-            # Apply time window filter if provided
-            if start_time or end_time:
-                if src_dep:
-                    if start_time and src_dep < start_time:
-                        continue
-                    if end_time and src_dep > end_time:
-                        continue
-                if tgt_arr:
-                    if start_time and tgt_arr < start_time:
-                        continue
-                    if end_time and tgt_arr > end_time:
-                        continue
-            
-            flights.add(src_flight)
-            flights.add(tgt_flight)
+    if resource_index is None:
+        resource_edges = [
+            (src_flight, tgt_flight, key)
+            for src_flight, tgt_flight, key, data in G.edges(keys=True, data=True)
+            if data.get('type') == resource_type and data.get('edge_label') == resource_id
+        ]
+    else:
+        resource_edges = resource_index.get((resource_type, resource_id), ())
+    
+    for src_flight, tgt_flight, key in resource_edges:
+        src_node = G.nodes[src_flight]
+        tgt_node = G.nodes[tgt_flight]
+        
+        # Get flight times
+        src_dep_str = src_node.get('sch_dep_gmt')
+        src_dep = parse_iso8601_datetime_cached(src_dep_str) if src_dep_str else None
+        tgt_arr_str = tgt_node.get('act_arr_gmt') or tgt_node.get('sch_arr_gmt')
+        tgt_arr = parse_iso8601_datetime_cached(tgt_arr_str) if tgt_arr_str else None
+        
+        # Apply time window filter if provided
+        if start_time or end_time:
+            if src_dep:
+                if start_time and src_dep < start_time:
+                    continue
+                if end_time and src_dep > end_time:
+                    continue
+            if tgt_arr:
+                if start_time and tgt_arr < start_time:
+                    continue
+                if end_time and tgt_arr > end_time:
+                    continue
+        
+        flights.add(src_flight)
+        flights.add(tgt_flight)
     
     return flights
 
@@ -158,41 +190,34 @@ def get_delayed_flights_affecting_resources(G: nx.MultiDiGraph, delay_threshold_
     Returns:
         Dictionary mapping delayed flight IDs to list of potentially affected flights
     """
-    affected_flights = {}
+    # Scheduled vs actual arrival of every flight, parsed in one vectorized
+    # pass (missing or unparseable times become NaT and are never delayed)
+    arrivals = pd.DataFrame.from_dict(
+        {flight_id: (node.get('sch_arr_gmt'), node.get('act_arr_gmt')) for flight_id, node in G.nodes(data=True)},
+        orient='index',
+        columns=['sch_arr_gmt', 'act_arr_gmt'],
+    )
+    sch_arr = pd.to_datetime(arrivals['sch_arr_gmt'], utc=True, errors='coerce', format='ISO8601')
+    act_arr = pd.to_datetime(arrivals['act_arr_gmt'], utc=True, errors='coerce', format='ISO8601')
+    delay_minutes = (act_arr - sch_arr).dt.total_seconds() / 60
+    delayed = delay_minutes[delay_minutes > delay_threshold_minutes]
     
-    for flight_id in G.nodes():
-        node = G.nodes[flight_id]
-        
-        # Check if flight has delay
-        sch_arr_str = node.get('sch_arr_gmt')
-        act_arr_str = node.get('act_arr_gmt')
-        
-        if not sch_arr_str or not act_arr_str:
-            continue
-        
-        sch_arr = parse_iso8601_datetime(sch_arr_str)
-        act_arr = parse_iso8601_datetime(act_arr_str)
-        
-        if not sch_arr or not act_arr:
-            continue
-        
-        delay_minutes = (act_arr - sch_arr).total_seconds() / 60
+    affected_flights = {}
+    for flight_id, flight_delay in delayed.items():
+        # Find all downstream flights via resource connections
+        downstream = []
+        for src_flight, tgt_flight, key, data in G.out_edges(flight_id, keys=True, data=True):
+            downstream.append({
+                'flight_id': tgt_flight,
+                'resource_type': data.get('type', 'unknown'),
+                'resource_id': data.get('edge_label', ''),
+            })
         
-        if delay_minutes > delay_threshold_minutes:
-            # Find all downstream flights via resource connections
-            downstream = []
-            for src_flight, tgt_flight, key, data in G.out_edges(flight_id, keys=True, data=True):
-                downstream.append({
-                    'flight_id': tgt_flight,
-                    'resource_type': data.get('type', 'unknown'),
-                    'resource_id': data.get('edge_label', ''),
-                })
-            
-            if downstream:
-                affected_flights[flight_id] = {
-                    'delay_minutes': delay_minutes,
-                    'downstream_flights': downstream,
-                }
+        if downstream:
+            affected_flights[flight_id] = {
+                'delay_minutes': float(flight_delay),
+                'downstream_flights': downstream,
+            }
     
     return affected_flights
 
@@ -271,7 +296,9 @@ def main():
     print("=" * 60)
     
     aircraft_id = "8231"  # Example aircraft
-    flights = get_flights_by_resource(G, "AIRCRAFT_TURN", aircraft_id)
+    # Index resources once; the graph does not change while querying
+    resource_index = build_resource_index(G)
+    flights = get_flights_by_resource(G, "AIRCRAFT_TURN", aircraft_id, resource_index=resource_index)
     print(f"\nAircraft {aircraft_id} is used by {len(flights)} flights:")
     for flight_id in sorted(flights):
         node = G.nodes[flight_id]
@@ -29,7 +29,14 @@ except ImportError as e:
 
 
 def parse_iso8601_datetime(date_str):
-    """Parse ISO 8601 datetime string to datetime object."""
+    """
+    Parse ISO 8601 datetime string to datetime object.
+    
+    Datetime values are returned unchanged: freshly built graphs keep snapshot
+    timestamps as datetimes, while graphs loaded from JSON hold ISO strings.
+    """
+    if isinstance(date_str, datetime):
+        return date_str
     if not date_str or date_str.strip() == '':
         return None
     try:
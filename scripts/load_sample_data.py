@@ -12,17 +12,53 @@ This script loads the sample CSV files and validates:
 
 import csv
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Dict, List, Tuple, Optional
 
+import pandas as pd
+
 # Add parent directory to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@dataclass(slots=True, frozen=True)
+class FlightRecord:
+    """
+    A validated flight loaded from flights_sample.csv.
+    
+    String fields are normalized at load time (stripped, empty string when
+    absent), so callers can use plain attribute access instead of dict.get.
+    """
+    carrier: str
+    flight_number: str
+    origin: str
+    destination: str
+    scheduled_departure_gate: Optional[datetime]
+    actual_departure_gate: Optional[datetime]
+    scheduled_arrival_gate: Optional[datetime]
+    actual_arrival_gate: Optional[datetime]
+    equipment: str
+    equipment_class: str
+    flight_date: Optional[date]
+    flight_month_year: str
+    departure_delay_minutes: Optional[int]
+    arrival_delay_minutes: Optional[int]
+    flight_id: Optional[str]
+
+
 def parse_iso8601_datetime(date_str: str) -> Optional[datetime]:
-    """Parse ISO 8601 datetime string to datetime object."""
+    """
+    Parse ISO 8601 datetime string to datetime object.
+    
+    Datetime values are returned unchanged: freshly built graphs keep edge
+    timestamps as datetimes, while graphs loaded from JSON hold ISO strings.
+    """
+    if isinstance(date_str, datetime):
+        return date_str
     if not date_str or date_str.strip() == '':
         return None
     
@@ -41,6 +77,49 @@ def parse_iso8601_datetime(date_str: str) -> Optional[datetime]:
         return None
 
 
+@lru_cache(maxsize=200_000)
+def parse_iso8601_datetime_cached(date_str: str) -> Optional[datetime]:
+    """
+    Memoized parse_iso8601_datetime for query code that parses the same
+    timestamp strings over and over (e.g. dashboard reruns).
+    
+    Datetimes are immutable, so cached results are safe to share.
+    """
+    return parse_iso8601_datetime(date_str)
+
+
+# UTC offset at the end of an ISO 8601 time ("+05:30", "-0500"); "Z" and
+# values without an offset are UTC
+ISO8601_OFFSET_PATTERN = r'\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?([+-]\d{2}:?\d{2})$'
+
+
+def parse_iso8601_column(values: pd.Series) -> List[Optional[datetime]]:
+    """
+    Parse a column of ISO 8601 datetime strings in one vectorized pass.
+    
+    Same results as parse_iso8601_datetime: naive values are treated as UTC
+    and values written with an offset keep that offset. Empty or
+    unparseable values become None.
+    """
+    parsed = pd.to_datetime(values, utc=True, errors='coerce', format='ISO8601')
+    
+    # Report unparseable values, as parse_iso8601_datetime does
+    for raw in values[parsed.isna() & (values != '')]:
+        print(f"  ⚠️  Error parsing datetime '{raw}'")
+    
+    # Everything was parsed to UTC; convert values written with another
+    # offset back to it, one group per distinct offset
+    results = pd.Series(parsed.dt.to_pydatetime(), index=values.index, dtype=object)
+    offsets = values.str.extract(ISO8601_OFFSET_PATTERN, expand=False)
+    for offset in offsets.dropna().unique():
+        tz = datetime.fromisoformat('2000-01-01T00:00:00' + offset).tzinfo
+        if tz.utcoffset(None):
+            in_offset = (offsets == offset) & parsed.notna()
+            results[in_offset] = list(parsed[in_offset].dt.tz_convert(tz).dt.to_pydatetime())
+    
+    return results.where(parsed.notna(), None).tolist()
+
+
 def load_airports(file_path: Path) -> Dict[str, Dict]:
     """Load airports from CSV file."""
     airports = {}
@@ -79,7 +158,7 @@ def load_airports(file_path: Path) -> Dict[str, Dict]:
     return airports
 
 
-def load_flights(file_path: Path, airports: Dict[str, Dict]) -> List[Dict]:
+def load_flights(file_path: Path, airports: Dict[str, Dict]) -> List[FlightRecord]:
     """Load flights from CSV file and validate against airports."""
     flights = []
     errors = []
@@ -98,131 +177,140 @@ def load_flights(file_path: Path, airports: Dict[str, Dict]) -> List[Dict]:
         'flight_date', 'flight_month_year'
     ]
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    # Read every column as a string so validation sees the raw values
+    df = pd.read_csv(file_path, dtype=str, keep_default_na=False, encoding='utf-8')
+    
+    # Validate header
+    header = list(df.columns)
+    missing_fields = [f for f in required_fields if f not in header]
+    if missing_fields:
+        errors.append(f"Missing required fields in header: {', '.join(missing_fields)}")
+    
+    def column(name: str) -> pd.Series:
+        if name not in df.columns:
+            return pd.Series('', index=df.index)
+        return df[name].str.strip()
+    
+    # Parse temporal fields column-wise instead of once per row
+    rows = zip(
+        column('carrier').str.upper(),
+        column('flight_number'),
+        column('origin').str.upper(),
+        column('destination').str.upper(),
+        parse_iso8601_column(column('scheduled_departure_gate')),
+        parse_iso8601_column(column('actual_departure_gate')),
+        parse_iso8601_column(column('scheduled_arrival_gate')),
+        parse_iso8601_column(column('actual_arrival_gate')),
+        column('equipment'),
+        column('equipment_class').str.upper(),
+        column('flight_date'),
+        column('flight_month_year'),
+    )
+    
+    for row_num, (carrier, flight_number, origin, destination,
+                  scheduled_departure, actual_departure,
+                  scheduled_arrival, actual_arrival,
+                  equipment, equipment_class,
+                  flight_date_str, flight_month_year) in enumerate(rows, start=2):
+        row_errors = []
+        row_warnings = []
         
-        # Validate header
-        header = reader.fieldnames or []
-        missing_fields = [f for f in required_fields if f not in header]
-        if missing_fields:
-            errors.append(f"Missing required fields in header: {', '.join(missing_fields)}")
+        # Validate required fields
+        if not carrier:
+            row_errors.append("Missing carrier")
+        if not flight_number:
+            row_errors.append("Missing flight_number")
+        if not origin:
+            row_errors.append("Missing origin")
+        if not destination:
+            row_errors.append("Missing destination")
         
-        for row_num, row in enumerate(reader, start=2):
-            flight = {}
-            row_errors = []
-            row_warnings = []
-            
-            # Required string fields
-            carrier = row.get('carrier', '').strip().upper()
-            flight_number = row.get('flight_number', '').strip()
-            origin = row.get('origin', '').strip().upper()
-            destination = row.get('destination', '').strip().upper()
-            
-            # Validate required fields
-            if not carrier:
-                row_errors.append("Missing carrier")
-            if not flight_number:
-                row_errors.append("Missing flight_number")
-            if not origin:
-                row_errors.append("Missing origin")
-            if not destination:
-                row_errors.append("Missing destination")
-            
-            # Validate airports exist
-            if origin and origin not in airports:
-                row_warnings.append(f"Origin airport '{origin}' not found in airports data")
-            if destination and destination not in airports:
-                row_warnings.append(f"Destination airport '{destination}' not found in airports data")
-            
-            # Validate route
-            if origin == destination:
-                row_errors.append(f"Origin and destination are the same: {origin}")
-            
-            # Parse temporal fields
-            scheduled_departure = parse_iso8601_datetime(row.get('scheduled_departure_gate', ''))
-            actual_departure = parse_iso8601_datetime(row.get('actual_departure_gate', ''))
-            scheduled_arrival = parse_iso8601_datetime(row.get('scheduled_arrival_gate', ''))
-            actual_arrival = parse_iso8601_datetime(row.get('actual_arrival_gate', ''))
-            
-            if not scheduled_departure:
-                row_errors.append("Missing or invalid scheduled_departure_gate")
-            if not scheduled_arrival:
-                row_errors.append("Missing or invalid scheduled_arrival_gate")
-            if not actual_departure:
-                row_warnings.append("Missing or invalid actual_departure_gate")
-            if not actual_arrival:
-                row_warnings.append("Missing or invalid actual_arrival_gate")
-            
-            # Validate temporal logic
-            if scheduled_departure and scheduled_arrival:
-                if scheduled_departure >= scheduled_arrival:
-                    row_errors.append("Scheduled departure must be before scheduled arrival")
-            
-            if actual_departure and actual_arrival:
-                if actual_departure >= actual_arrival:
-                    row_errors.append("Actual departure must be before actual arrival")
-            
-            # Parse date fields
-            flight_date_str = row.get('flight_date', '').strip()
-            flight_month_year = row.get('flight_month_year', '').strip()
-            
-            try:
-                flight_date = datetime.fromisoformat(flight_date_str).date() if flight_date_str else None
-            except ValueError:
-                flight_date = None
-                row_errors.append(f"Invalid flight_date format: {flight_date_str}")
-            
-            # Validate month_year format (YYYYMM)
-            if flight_month_year and len(flight_month_year) != 6:
-                row_warnings.append(f"flight_month_year should be YYYYMM format, got: {flight_month_year}")
-            
-            # Build flight dict
-            flight = {
-                'carrier': carrier,
-                'flight_number': flight_number,
-                'origin': origin,
-                'destination': destination,
-                'scheduled_departure_gate': scheduled_departure,
-                'actual_departure_gate': actual_departure,
-                'scheduled_arrival_gate': scheduled_arrival,
-                'actual_arrival_gate': actual_arrival,
-                'equipment': row.get('equipment', '').strip(),
-                'equipment_class': row.get('equipment_class', '').strip().upper(),
-                'flight_date': flight_date,
-                'flight_month_year': flight_month_year,
-            }
-            
-            # Calculate delays if both scheduled and actual times available
-            if scheduled_departure and actual_departure:
-                delay_seconds = (actual_departure - scheduled_departure).total_seconds()
-                flight['departure_delay_minutes'] = int(delay_seconds / 60)
-            else:
-                flight['departure_delay_minutes'] = None
-            
-            if scheduled_arrival and actual_arrival:
-                delay_seconds = (actual_arrival - scheduled_arrival).total_seconds()
-                flight['arrival_delay_minutes'] = int(delay_seconds / 60)
-            else:
-                flight['arrival_delay_minutes'] = None
-            
-            # Generate flight_id
-            if carrier and flight_number and origin and destination and flight_date:
-                flight['flight_id'] = f"{carrier}{flight_number}_{flight_date}_{origin}_{destination}"
-            else:
-                flight['flight_id'] = None
-            
-            # Report errors and warnings
-            if row_errors:
-                errors.append(f"Row {row_num}: {', '.join(row_errors)}")
-            if row_warnings:
-                warnings.extend([f"Row {row_num}: {w}" for w in row_warnings])
-            
-            # Only add flights without critical errors
-            if not row_errors:
-                flights.append(flight)
-            else:
-                print(f"  ❌ Row {row_num}: Skipped due to errors: {', '.join(row_errors)}")
-    
+        # Validate airports exist
+        if origin and origin not in airports:
+            row_warnings.append(f"Origin airport '{origin}' not found in airports data")
+        if destination and destination not in airports:
+            row_warnings.append(f"Destination airport '{destination}' not found in airports data")
+        
+        # Validate route
+        if origin == destination:
+            row_errors.append(f"Origin and destination are the same: {origin}")
+        
+        if not scheduled_departure:
+            row_errors.append("Missing or invalid scheduled_departure_gate")
+        if not scheduled_arrival:
+            row_errors.append("Missing or invalid scheduled_arrival_gate")
+        if not actual_departure:
+            row_warnings.append("Missing or invalid actual_departure_gate")
+        if not actual_arrival:
+            row_warnings.append("Missing or invalid actual_arrival_gate")
+        
+        # Validate temporal logic
+        if scheduled_departure and scheduled_arrival:
+            if scheduled_departure >= scheduled_arrival:
+                row_errors.append("Scheduled departure must be before scheduled arrival")
+        
+        if actual_departure and actual_arrival:
+            if actual_departure >= actual_arrival:
+                row_errors.append("Actual departure must be before actual arrival")
+        
+        # Parse date fields
+        try:
+            flight_date = datetime.fromisoformat(flight_date_str).date() if flight_date_str else None
+        except ValueError:
+            flight_date = None
+            row_errors.append(f"Invalid flight_date format: {flight_date_str}")
+        
+        # Validate month_year format (YYYYMM)
+        if flight_month_year and len(flight_month_year) != 6:
+            row_warnings.append(f"flight_month_year should be YYYYMM format, got: {flight_month_year}")
+        
+        # Calculate delays if both scheduled and actual times available
+        if scheduled_departure and actual_departure:
+            delay_seconds = (actual_departure - scheduled_departure).total_seconds()
+            departure_delay_minutes = int(delay_seconds / 60)
+        else:
+            departure_delay_minutes = None
+        
+        if scheduled_arrival and actual_arrival:
+            delay_seconds = (actual_arrival - scheduled_arrival).total_seconds()
+            arrival_delay_minutes = int(delay_seconds / 60)
+        else:
+            arrival_delay_minutes = None
+        
+        # Generate flight_id
+        if carrier and flight_number and origin and destination and flight_date:
+            flight_id = f"{carrier}{flight_number}_{flight_date}_{origin}_{destination}"
+        else:
+            flight_id = None
+        
+        # Report errors and warnings
+        if row_errors:
+            errors.append(f"Row {row_num}: {', '.join(row_errors)}")
+        if row_warnings:
+            warnings.extend([f"Row {row_num}: {w}" for w in row_warnings])
+        
+        # Only add flights without critical errors
+        if not row_errors:
+            flights.append(FlightRecord(
+                carrier=carrier,
+                flight_number=flight_number,
+                origin=origin,
+                destination=destination,
+                scheduled_departure_gate=scheduled_departure,
+                actual_departure_gate=actual_departure,
+                scheduled_arrival_gate=scheduled_arrival,
+                actual_arrival_gate=actual_arrival,
+                equipment=equipment,
+                equipment_class=equipment_class,
+                flight_date=flight_date,
+                flight_month_year=flight_month_year,
+                departure_delay_minutes=departure_delay_minutes,
+                arrival_delay_minutes=arrival_delay_minutes,
+                flight_id=flight_id,
+            ))
+        else:
+            print(f"  ❌ Row {row_num}: Skipped due to errors: {', '.join(row_errors)}")
+
     print(f"  ✓ Loaded {len(flights)} valid flights")
     
     if warnings:
@@ -242,7 +330,7 @@ def load_flights(file_path: Path, airports: Dict[str, Dict]) -> List[Dict]:
     return flights
 
 
-def validate_data(airports: Dict[str, Dict], flights: List[Dict]) -> Tuple[bool, List[str]]:
+def validate_data(airports: Dict[str, Dict], flights: List[FlightRecord]) -> Tuple[bool, List[str]]:
     """Validate loaded data for schema compliance."""
     issues = []
     
@@ -262,8 +350,8 @@ def validate_data(airports: Dict[str, Dict], flights: List[Dict]) -> Tuple[bool,
         return False, issues
     
     # Check route coverage
-    unique_origins = set(f['origin'] for f in flights)
-    unique_destinations = set(f['destination'] for f in flights)
+    unique_origins = set(f.origin for f in flights)
+    unique_destinations = set(f.destination for f in flights)
     unique_airports_in_flights = unique_origins | unique_destinations
     
     airports_not_in_data = unique_airports_in_flights - set(airports.keys())
@@ -272,17 +360,17 @@ def validate_data(airports: Dict[str, Dict], flights: List[Dict]) -> Tuple[bool,
     
     # Validate flight attributes
     for flight in flights:
-        if not flight.get('flight_id'):
-            issues.append(f"Flight {flight.get('carrier', '?')}{flight.get('flight_number', '?')}: Missing flight_id")
+        if not flight.flight_id:
+            issues.append(f"Flight {flight.carrier}{flight.flight_number}: Missing flight_id")
         
-        if flight.get('scheduled_departure_gate') and not flight['scheduled_departure_gate'].tzinfo:
-            issues.append(f"Flight {flight.get('flight_id', '?')}: scheduled_departure_gate missing timezone")
+        if flight.scheduled_departure_gate and not flight.scheduled_departure_gate.tzinfo:
+            issues.append(f"Flight {flight.flight_id}: scheduled_departure_gate missing timezone")
         
-        if flight.get('scheduled_arrival_gate') and not flight['scheduled_arrival_gate'].tzinfo:
-            issues.append(f"Flight {flight.get('flight_id', '?')}: scheduled_arrival_gate missing timezone")
+        if flight.scheduled_arrival_gate and not flight.scheduled_arrival_gate.tzinfo:
+            issues.append(f"Flight {flight.flight_id}: scheduled_arrival_gate missing timezone")
     
     # Check for duplicate flight_ids
-    flight_ids = [f.get('flight_id') for f in flights if f.get('flight_id')]
+    flight_ids = [f.flight_id for f in flights if f.flight_id]
     duplicates = [fid for fid in set(flight_ids) if flight_ids.count(fid) > 1]
     if duplicates:
         issues.append(f"Duplicate flight_ids found: {', '.join(duplicates)}")
@@ -299,7 +387,7 @@ def validate_data(airports: Dict[str, Dict], flights: List[Dict]) -> Tuple[bool,
         return True, []
 
 
-def print_summary(airports: Dict[str, Dict], flights: List[Dict]):
+def print_summary(airports: Dict[str, Dict], flights: List[FlightRecord]):
     """Print summary statistics."""
     print(f"\n📊 Data Summary")
     print(f"=" * 60)
@@ -313,7 +401,7 @@ def print_summary(airports: Dict[str, Dict], flights: List[Dict]):
     # Route statistics
     routes = {}
     for flight in flights:
-        route = f"{flight['origin']} → {flight['destination']}"
+        route = f"{flight.origin} → {flight.destination}"
         routes[route] = routes.get(route, 0) + 1
     
     print(f"\nRoutes ({len(routes)} unique):")
@@ -323,7 +411,7 @@ def print_summary(airports: Dict[str, Dict], flights: List[Dict]):
     # Carrier statistics
     carriers = {}
     for flight in flights:
-        carrier = flight.get('carrier', 'UNKNOWN')
+        carrier = flight.carrier or 'UNKNOWN'
         carriers[carrier] = carriers.get(carrier, 0) + 1
     
     print(f"\nCarriers ({len(carriers)} unique):")
@@ -331,8 +419,8 @@ def print_summary(airports: Dict[str, Dict], flights: List[Dict]):
         print(f"  - {carrier}: {count} flight(s)")
     
     # Delay statistics
-    departure_delays = [f['departure_delay_minutes'] for f in flights if f.get('departure_delay_minutes') is not None]
-    arrival_delays = [f['arrival_delay_minutes'] for f in flights if f.get('arrival_delay_minutes') is not None]
+    departure_delays = [f.departure_delay_minutes for f in flights if f.departure_delay_minutes is not None]
+    arrival_delays = [f.arrival_delay_minutes for f in flights if f.arrival_delay_minutes is not None]
     
     if departure_delays:
         avg_dep_delay = sum(departure_delays) / len(departure_delays)
@@ -351,8 +439,8 @@ def print_summary(airports: Dict[str, Dict], flights: List[Dict]):
         print(f"  - Early: {sum(1 for d in arrival_delays if d < -1)} flights")
     
     # Temporal coverage
-    flight_dates = set(f.get('flight_date') for f in flights if f.get('flight_date'))
-    flight_months = set(f.get('flight_month_year') for f in flights if f.get('flight_month_year'))
+    flight_dates = set(f.flight_date for f in flights if f.flight_date)
+    flight_months = set(f.flight_month_year for f in flights if f.flight_month_year)
     
     print(f"\nTemporal Coverage:")
     print(f"  - Dates: {len(flight_dates)} unique date(s): {', '.join(sorted(str(d) for d in flight_dates))}")